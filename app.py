@@ -1,8 +1,8 @@
 import streamlit as st
+import hashlib
 import random
-import requests
 import time
-from fpdf import FPDF
+import uuid
 import smtplib
 import json
 from email.mime.text import MIMEText
@@ -10,6 +10,17 @@ from email.mime.multipart import MIMEMultipart
 import streamlit.components.v1 as components  # Required for scrolling
 import pandas as pd
 import plotly.express as px
+from artifacts import get_artifact_store
+from config import data_path
+from outbox import Outbox
+from pdf_fonts import UnicodeFPDF, pdf_text
+from progress import RESUMABLE_STEPS, checkpoint_session, get_progress_store, new_resume_token, restore_session
+from question_bank import LIKERT_OPTIONS, QUESTION_BANK_VERSION, encode_answers, new_order_seed, question_order
+from recovery import get_result_index, recover_results
+from report_charts import CHART_VERSION, chart_png, draw_chart_row
+from report_fragments import FragmentStore, build_pdf_template, personalize_pdf
+from scoring import ADAPTIVE_PAGE_SIZE, ENGINE as SCORING_ENGINE, normalize_role_key
+from storage import get_storage
 
 # --- 1. CONFIGURATION ---
 st.set_page_config(
@@ -204,114 +215,8 @@ ROLE_RELATIONSHIP_LABELS = {
     "YDP": {"directReportsLabel": "peers", "youthLabel": "youth in your care", "supervisorLabel": "Shift Supervisor", "leadershipLabel": "Program Supervisor"}
 }
 
-# --- ASSESSMENT QUESTIONS (OPTIMIZED HYBRID FORMAT) ---
-# Format types:
-#   - likert: 1–5 scale (behavior frequency / "most days")
-#   - forced: pick ONE of two statements (tradeoff / priority check)
-#
-# Notes:
-#   - This hybrid format improves discrimination and reduces "agree with everything" inflation.
-#   - Forced-choice items are used as tie-breakers and to reduce response bias.
-
-LIKERT_OPTIONS = [1, 2, 3, 4, 5]
-LIKERT_LABELS = {
-    1: "Strongly Disagree",
-    2: "Disagree",
-    3: "Neutral",
-    4: "Agree",
-    5: "Strongly Agree",
-}
-
-# Weights (keep simple + stable)
-LIKERT_WEIGHT = 1.0
-FORCED_WEIGHT = 3.0          # chosen option adds 3 points to its mapped style/driver
-STRESS_WEIGHT = 1.2          # small boost so stress-pattern items shape the primary/secondary more
-
-# --- Part 1: Communication Style (Day-to-day + Under Stress + Priority Check) ---
-COMM_QUESTIONS = [
-    # Director (Day-to-day)
-    {"id":"cL1","type":"likert","style":"Director","text":"When things feel unstructured, I naturally step in to define clear expectations and move us toward action."},
-    {"id":"cL2","type":"likert","style":"Director","text":"I feel most effective when I see staff utilizing their training and resources to solve problems rather than waiting for me to decide."},
-    {"id":"cL3","type":"likert","style":"Director","text":"In fast-moving situations, I prioritize momentum over discussion."},
-    {"id":"cL4","type":"likert","style":"Director","text":"Others often look to me when a decision needs to be made quickly."},
-    {"id":"cL5","type":"likert","style":"Director","text":"I would rather adjust a plan later than stall progress now."},
-
-    # Encourager (Day-to-day)
-    {"id":"cL6","type":"likert","style":"Encourager","text":"I pay close attention to how stress or morale is affecting the team."},
-    {"id":"cL7","type":"likert","style":"Encourager","text":"I intentionally name effort and wins to keep people motivated."},
-    {"id":"cL8","type":"likert","style":"Encourager","text":"After a crisis or hard shift, I prioritize reflecting with the team to process what happened."},
-    {"id":"cL9","type":"likert","style":"Encourager","text":"I feel confident encouraging staff to use their own problem-solving skills rather than giving them an immediate answer."},
-    {"id":"cL10","type":"likert","style":"Encourager","text":"I believe how we treat each other matters as much as what we get done."},
-
-    # Facilitator (Day-to-day)
-    {"id":"cL11","type":"likert","style":"Facilitator","text":"I help slow conversations down so everyone feels heard."},
-    {"id":"cL12","type":"likert","style":"Facilitator","text":"I often restate or summarize to help people understand each other."},
-    {"id":"cL13","type":"likert","style":"Facilitator","text":"I prefer shared buy-in over unilateral decisions."},
-    {"id":"cL14","type":"likert","style":"Facilitator","text":"I stay relatively calm when others are escalated."},
-    {"id":"cL15","type":"likert","style":"Facilitator","text":"I pay attention to how decisions are made, not just the result."},
-
-    # Tracker (Day-to-day)
-    {"id":"cL16","type":"likert","style":"Tracker","text":"When I notice gaps in documentation or routines, I view them as opportunities to teach or improve the system."},
-    {"id":"cL17","type":"likert","style":"Tracker","text":"I’m uncomfortable when expectations or procedures feel vague."},
-    {"id":"cL18","type":"likert","style":"Tracker","text":"I naturally track details others miss."},
-    {"id":"cL19","type":"likert","style":"Tracker","text":"I feel responsible for maintaining standards and consistency."},
-    {"id":"cL20","type":"likert","style":"Tracker","text":"I ask clarifying questions to prevent future problems."},
-
-    # Under stress (weighted)
-    {"id":"cS1","type":"likert","style":"Director","weight":STRESS_WEIGHT,"text":"Under pressure, I tend to take control immediately because I worry others won't complete the task effectively."},
-    {"id":"cS2","type":"likert","style":"Encourager","weight":STRESS_WEIGHT,"text":"When stressed, I become more emotionally attuned to others."},
-    {"id":"cS3","type":"likert","style":"Facilitator","weight":STRESS_WEIGHT,"text":"In conflict, I try to slow things down and reduce intensity."},
-    {"id":"cS4","type":"likert","style":"Tracker","weight":STRESS_WEIGHT,"text":"When anxious, I focus more on rules, procedures, or correctness."},
-
-    # Priority check (forced choice)
-    {"id":"cF1","type":"forced","prompt":"In a difficult shift, I’m more focused on…","a_text":"Making a clear decision and moving the team forward.","a_style":"Director","b_text":"Making sure people feel supported and steady.","b_style":"Encourager"},
-    {"id":"cF2","type":"forced","prompt":"When plans are unclear, I’m more likely to…","a_text":"Step in and define direction quickly.","a_style":"Director","b_text":"Ask questions and build alignment first.","b_style":"Facilitator"},
-    {"id":"cF3","type":"forced","prompt":"When something feels off, my first instinct is to…","a_text":"Check the details, expectations, and process gaps.","a_style":"Tracker","b_text":"Check the human dynamics and emotional temperature.","b_style":"Encourager"},
-    {"id":"cF4","type":"forced","prompt":"When disagreement starts escalating, I’m more likely to…","a_text":"Set the boundary and end the debate.","a_style":"Director","b_text":"Slow down, reflect back, and de-escalate.","b_style":"Facilitator"},
-]
-
-# --- Part 2: Motivation Drivers (Day-to-day + Priority Check + Burnout Context) ---
-MOTIVATION_QUESTIONS = [
-    # Growth
-    {"id":"mL1","type":"likert","style":"Growth","text":"I view difficult behaviors or shifts as opportunities to build new skills."},
-    {"id":"mL2","type":"likert","style":"Growth","text":"I’m motivated by opportunities to improve my skills."},
-    {"id":"mL3","type":"likert","style":"Growth","text":"Doing the same work repeatedly drains my energy."},
-    {"id":"mL4","type":"likert","style":"Growth","text":"Feedback that helps me grow matters to me."},
-    {"id":"mL5","type":"likert","style":"Growth","text":"I feel motivated when there is an environment of support for my development."},
-
-    # Purpose
-    {"id":"mL6","type":"likert","style":"Purpose","text":"I need to feel my work aligns with values about youth and dignity."},
-    {"id":"mL7","type":"likert","style":"Purpose","text":"Decisions that don’t make sense for youth bother me deeply."},
-    {"id":"mL8","type":"likert","style":"Purpose","text":"Meaning matters more to me than efficiency alone."},
-    {"id":"mL9","type":"likert","style":"Purpose","text":"I feel proud when I can see real impact."},
-    {"id":"mL10","type":"likert","style":"Purpose","text":"I set goals for myself to achieve even if those goals were not clearly set by others."},
-
-    # Connection
-    {"id":"mL11","type":"likert","style":"Connection","text":"Feeling connected to coworkers affects my motivation."},
-    {"id":"mL12","type":"likert","style":"Connection","text":"Team tension drains my energy quickly."},
-    {"id":"mL13","type":"likert","style":"Connection","text":"I value being known and supported by my supervisor."},
-    {"id":"mL14","type":"likert","style":"Connection","text":"I’m more likely to go above and beyond when I feel valued and supported."},
-    {"id":"mL15","type":"likert","style":"Connection","text":"When the team feels disconnected, I feel motivated to communicate and resolve the tension."},
-
-    # Achievement
-    {"id":"mL16","type":"likert","style":"Achievement","text":"Clear goals help me feel effective."},
-    {"id":"mL17","type":"likert","style":"Achievement","text":"I like knowing exactly what success looks like."},
-    {"id":"mL18","type":"likert","style":"Achievement","text":"I’m motivated by measurable progress."},
-    {"id":"mL19","type":"likert","style":"Achievement","text":"I feel satisfied when I can see that my effort led to positive improvements."},
-    {"id":"mL20","type":"likert","style":"Achievement","text":"Ambiguous expectations frustrate me."},
-
-    # Priority check (forced choice)
-    {"id":"mF1","type":"forced","prompt":"What drains me faster?","a_text":"Lack of progress / unclear outcomes.","a_style":"Achievement","b_text":"Lack of connection / tension on the team.","b_style":"Connection"},
-    {"id":"mF2","type":"forced","prompt":"What restores me faster?","a_text":"Seeing improvement, mastery, or learning.","a_style":"Growth","b_text":"Seeing real positive impact on youth/people.","b_style":"Purpose"},
-    {"id":"mF3","type":"forced","prompt":"If I’m frustrated at work, it’s usually because…","a_text":"The system isn’t matching the mission for youth.","a_style":"Purpose","b_text":"Expectations and targets aren’t clear or stable.","b_style":"Achievement"},
-    {"id":"mF4","type":"forced","prompt":"If I’m offered a new opportunity, I’m more likely to say yes when…","a_text":"It builds my skills and stretches me.","a_style":"Growth","b_text":"It deepens relationships and team connection.","b_style":"Connection"},
-
-    # Burnout context (stored separately; not used to select primary/secondary)
-    {"id":"mB1","type":"likert","style":"Context","text":"When I feel emotionally exhausted, even work I care about becomes hard to engage with."},
-    {"id":"mB2","type":"likert","style":"Context","text":"When I’m burned out, I become more detached or numb during the shift."},
-    {"id":"mB3","type":"likert","style":"Context","text":"When I’m burned out, small problems feel bigger than they should."},
-    {"id":"mB4","type":"likert","style":"Context","text":"After an emotionally or physically draining week, I find it difficult to prioritize my own self-care."},
-]
+# --- ASSESSMENT QUESTIONS ---
+# The bank itself lives in question_bank.py; scoring.py compiles it into matrices.
 
 
 # --- DATA DICTIONARIES (Updated with new content) ---
@@ -955,100 +860,21 @@ INTEGRATED_PROFILES = {
 
 # --- 4. FUNCTIONS ---
 
-def normalize_role_key(role):
-    if not role: return "YDP"
-    r = role.lower()
-    if "program" in r: return "Program Supervisor"
-    if "shift" in r: return "Shift Supervisor"
-    return "YDP"
-
-def get_top_two(scores):
-    sorted_scores = sorted(scores.items(), key=lambda item: item[1], reverse=True)
-    primary = sorted_scores[0][0] if len(sorted_scores) > 0 else None
-    secondary = sorted_scores[1][0] if len(sorted_scores) > 1 else None
-    return primary, secondary
-
-def clean_text(text):
-    if not text: return ""
-    return text.replace('\u2018', "'").replace('\u2019', "'").replace('\u201c', '"').replace('\u201d', '"').replace('\u2013', '-').replace('—', '-').encode('latin-1', 'replace').decode('latin-1')
-
 def build_flat_answers_payload():
-    """Flatten all assessment answers into a single dict suitable for Google Sheets.
-
-    Keys are stable question IDs (e.g., cL1, cF1, mL1, mB1).
-    Values are human-readable:
-      - Likert items: integer 1-5
-      - Forced-choice items: the chosen statement text (A or B)
+    """Flatten all assessment answers into a single compact dict for storage.
 
-    This pairs well with an Apps Script that creates one column per question ID.
+    Keys are stable question IDs (e.g., cL1, cF1, mL1, mB1). Likert items are
+    integers 1-5 and forced-choice items are "A" or "B"; question_bank.decode_answers
+    expands them to readable text for the sheet or exports. The payload carries
+    QUESTION_BANK_VERSION alongside, so an answer can be tied to the wording shown.
     """
-    flat = {}
-
-    # Communication answers
-    comm_ans = st.session_state.get('answers_comm', {}) or {}
-    for q in COMM_QUESTIONS:
-        qid = q.get('id')
-        if not qid:
-            continue
-        raw = comm_ans.get(qid)
-        if raw is None:
-            continue
-        if q.get('type') == 'forced':
-            flat[qid] = q.get('a_text') if raw == 'A' else q.get('b_text')
-        else:
-            try:
-                flat[qid] = int(raw)
-            except Exception:
-                flat[qid] = raw
-
-    # Motivation answers (including burnout context)
-    mot_ans = st.session_state.get('answers_motiv', {}) or {}
-    for q in MOTIVATION_QUESTIONS:
-        qid = q.get('id')
-        if not qid:
-            continue
-        raw = mot_ans.get(qid)
-        if raw is None:
-            continue
-        if q.get('type') == 'forced':
-            flat[qid] = q.get('a_text') if raw == 'A' else q.get('b_text')
-        else:
-            try:
-                flat[qid] = int(raw)
-            except Exception:
-                flat[qid] = raw
-
-    return flat
+    return encode_answers(st.session_state.get('answers_comm'), st.session_state.get('answers_motiv'))
 
-def submit_to_google_sheets(data, action="save"):
-    """Send payload to Google Apps Script.
-
-    The backend can store both summary scores and, if provided, an `answers` dict
-    for per-question columns.
-    """
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
-    data["action"] = action
-    try:
-        resp = requests.post(url, json=data, timeout=15)
-        if resp.status_code != 200:
-            st.error(f"Google Sheets Error ({resp.status_code}): {resp.text}")
-            return False
-        return True
-    except Exception as e:
-        st.error(f"Connection Error: {e}")
-        return False
-
-def fetch_user_data(email):
-    # Attempts to fetch data from Google Scripts
-    # NOTE: Your Google Script must handle the 'retrieve' action for this to work.
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
-    try:
-        response = requests.post(url, json={"action": "retrieve", "email": email})
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception as e:
-        return None
+@st.cache_resource
+def get_outbox():
+    # Submissions are recorded locally first and drained to storage in the background.
+    # Payloads carry `submission_id`, which backends use to ignore redeliveries.
+    return Outbox(data_path("outbox.sqlite3"), send=get_storage().save).start()
 
 def generate_html_report(user_info, results, comm_prof, mot_prof, int_prof, role_key, role_labels):
     """
@@ -1238,26 +1064,30 @@ def generate_profile_content_user(comm, motiv):
         "cheat_fuel": m_data.get('boosters', [])
     }
 
-def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role_labels):
-    pdf = FPDF()
-    pdf.add_page()
+PDF_BLUE = (26, 115, 232)
+PDF_GREEN = (52, 168, 83)
+PDF_RED = (234, 67, 53)
+PDF_BLACK = (0, 0, 0)
+
+def new_report_pdf():
+    pdf = UnicodeFPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
-    
-    blue = (26, 115, 232)
-    green = (52, 168, 83)
-    red = (234, 67, 53)
-    black = (0, 0, 0)
-    
-    # Header
+    return pdf
+
+def draw_pdf_header(pdf, user_info):
+    # Fixed height (two single-line cells), so the body below never depends on it.
     pdf.set_font("Arial", 'B', 20)
-    pdf.set_text_color(*blue)
+    pdf.set_text_color(*PDF_BLUE)
     pdf.cell(0, 10, "Elmcrest Leadership Compass Profile", ln=True, align='C')
     
     pdf.set_font("Arial", '', 12)
-    pdf.set_text_color(*black)
-    pdf.cell(0, 8, clean_text(f"Prepared for: {user_info['name']} | Role: {user_info['role']}"), ln=True, align='C')
+    pdf.set_text_color(*PDF_BLACK)
+    pdf.cell(0, 8, f"Prepared for: {user_info['name']} | Role: {user_info['role']}", ln=True, align='C')
     pdf.ln(5)
-    
+
+def draw_pdf_body(pdf, results, comm_prof, mot_prof, int_prof, role_key):
+    blue, green, red, black = PDF_BLUE, PDF_GREEN, PDF_RED, PDF_BLACK
+
     # --- [CHANGE] Cheat Sheet Section Added ---
     data = generate_profile_content_user(results['primaryComm'], results['primaryMotiv'])
     
@@ -1274,7 +1104,7 @@ def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role
         pdf.set_font("Arial", '', 10)
         for item in items:
             clean_item = item.replace("**", "")
-            pdf.multi_cell(0, 5, clean_text(f"- {clean_item}"))
+            pdf.multi_cell(0, 5, f"- {clean_item}")
         pdf.ln(2)
 
     print_cheat_column("YOUR CORE STRENGTHS:", data['cheat_strengths'], green)
@@ -1289,12 +1119,13 @@ def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role
     # Comm
     pdf.set_font("Arial", 'B', 14)
     pdf.set_text_color(*blue)
-    pdf.cell(0, 10, clean_text(f"Communication: {comm_prof['name']}"), ln=True)
+    pdf.cell(0, 10, f"Communication: {comm_prof['name']}", ln=True)
+    draw_chart_row(pdf, [chart_png("quadrant", results['primaryComm'])])
     pdf.set_font("Arial", '', 11)
     pdf.set_text_color(*black)
     
     overview_text = comm_prof['overview'].replace("<strong>", "").replace("</strong>", "").replace("<br><br>", "\n\n")
-    pdf.multi_cell(0, 6, clean_text(overview_text))
+    pdf.multi_cell(0, 6, overview_text)
     pdf.ln(3)
     
     # Role Tips
@@ -1304,19 +1135,20 @@ def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role
     tips = comm_prof['roleTips'][role_key]
     pdf.set_font("Arial", '', 11)
     pdf.ln(2)
-    pdf.multi_cell(0, 6, clean_text(f"- Direct Reports: {tips['directReports']}"))
-    pdf.multi_cell(0, 6, clean_text(f"- Youth: {tips['youth']}"))
-    pdf.multi_cell(0, 6, clean_text(f"- Supervisor: {tips['supervisor']}"))
-    pdf.multi_cell(0, 6, clean_text(f"- Leadership: {tips['leadership']}"))
+    pdf.multi_cell(0, 6, f"- Direct Reports: {tips['directReports']}")
+    pdf.multi_cell(0, 6, f"- Youth: {tips['youth']}")
+    pdf.multi_cell(0, 6, f"- Supervisor: {tips['supervisor']}")
+    pdf.multi_cell(0, 6, f"- Leadership: {tips['leadership']}")
     pdf.ln(5)
 
     # Motiv
     pdf.set_font("Arial", 'B', 14)
     pdf.set_text_color(*blue)
-    pdf.cell(0, 10, clean_text(f"Motivation: {mot_prof['name']}"), ln=True)
+    pdf.cell(0, 10, f"Motivation: {mot_prof['name']}", ln=True)
+    draw_chart_row(pdf, [chart_png("gauge", results['primaryMotiv'])], height=35)
     pdf.set_font("Arial", '', 11)
     pdf.set_text_color(*black)
-    pdf.multi_cell(0, 6, clean_text(mot_prof['summary']))
+    pdf.multi_cell(0, 6, mot_prof['summary'])
     pdf.ln(3)
     
     pdf.set_font("Arial", 'B', 11)
@@ -1324,7 +1156,7 @@ def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role
     pdf.set_font("Arial", '', 11)
     for b in mot_prof['boosters']: 
         clean_b = b.replace("**", "")
-        pdf.multi_cell(0, 6, clean_text(f"- {clean_b}"))
+        pdf.multi_cell(0, 6, f"- {clean_b}")
     pdf.ln(2)
     
     pdf.set_font("Arial", 'B', 11)
@@ -1332,47 +1164,108 @@ def create_pdf(user_info, results, comm_prof, mot_prof, int_prof, role_key, role
     pdf.set_font("Arial", '', 11)
     for k in mot_prof['killers']: 
         clean_k = k.replace("**", "")
-        pdf.multi_cell(0, 6, clean_text(f"- {clean_k}"))
+        pdf.multi_cell(0, 6, f"- {clean_k}")
     pdf.ln(5)
     
     # Integrated
     if int_prof:
         pdf.set_font("Arial", 'B', 14)
         pdf.set_text_color(*blue)
-        pdf.cell(0, 10, clean_text(f"Integrated: {int_prof['title']}"), ln=True)
+        pdf.cell(0, 10, f"Integrated: {int_prof['title']}", ln=True)
+        draw_chart_row(pdf, [chart_png("compass", results['primaryComm'], results['primaryMotiv'])])
         pdf.set_font("Arial", '', 11)
         pdf.set_text_color(*black)
-        pdf.multi_cell(0, 6, clean_text(int_prof['summary']))
+        pdf.multi_cell(0, 6, int_prof['summary'])
         pdf.ln(2)
         
         # Strengths
         pdf.set_font("Arial", 'B', 11)
         pdf.cell(0, 8, "Strengths:", ln=True, fill=True)
         pdf.set_font("Arial", '', 11)
-        for s in int_prof['strengths']: pdf.multi_cell(0, 6, clean_text(f"- {s.replace('**', '')}"))
+        for s in int_prof['strengths']: pdf.multi_cell(0, 6, f"- {s.replace('**', '')}")
         pdf.ln(2)
 
         # Weaknesses
         pdf.set_font("Arial", 'B', 11)
         pdf.cell(0, 8, "Weaknesses:", ln=True, fill=True)
         pdf.set_font("Arial", '', 11)
-        for w in int_prof['weaknesses']: pdf.multi_cell(0, 6, clean_text(f"- {w.replace('**', '')}"))
+        for w in int_prof['weaknesses']: pdf.multi_cell(0, 6, f"- {w.replace('**', '')}")
         pdf.ln(2)
 
         # Comm Arch
         pdf.set_font("Arial", 'B', 11)
         pdf.cell(0, 8, "Communication Architecture:", ln=True, fill=True)
         pdf.set_font("Arial", '', 11)
-        for c in int_prof['comm_arch']: pdf.multi_cell(0, 6, clean_text(f"- {c.replace('**', '')}"))
+        for c in int_prof['comm_arch']: pdf.multi_cell(0, 6, f"- {c.replace('**', '')}")
         pdf.ln(2)
 
         # Roadmap
         pdf.set_font("Arial", 'B', 11)
         pdf.cell(0, 8, "Strategic Development Roadmap:", ln=True, fill=True)
         pdf.set_font("Arial", '', 11)
-        for r in int_prof['roadmap']: pdf.multi_cell(0, 6, clean_text(f"- {r.replace('**', '')}"))
-    
-    return pdf.output(dest='S').encode('latin-1')
+        for r in int_prof['roadmap']: pdf.multi_cell(0, 6, f"- {r.replace('**', '')}")
+
+# Reports are memoized per (user_info, results, content version). Bump the layout
+# version when draw_pdf_header/draw_pdf_body/generate_html_report change; profile text edits are hashed in.
+REPORT_LAYOUT_VERSION = 3
+REPORT_CONTENT_VERSION = f"{REPORT_LAYOUT_VERSION}.{CHART_VERSION}-" + hashlib.sha1(
+    json.dumps([COMM_PROFILES, MOTIVATION_PROFILES, INTEGRATED_PROFILES, ROLE_RELATIONSHIP_LABELS], sort_keys=True).encode('utf-8')
+).hexdigest()[:10]
+
+def report_cache_key(user_info, results):
+    payload = json.dumps([REPORT_CONTENT_VERSION, user_info, results], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+# Report bodies depend only on (primaryComm, primaryMotiv, role_key); see report_fragments.py.
+HTML_NAME_SLOT = "\x00name\x00"
+
+def _profiles_for(p_comm, p_mot, pack=None):
+    comm, motiv, integrated = pack or (COMM_PROFILES, MOTIVATION_PROFILES, INTEGRATED_PROFILES)
+    return comm[p_comm], motiv[p_mot], integrated.get(f"{p_comm}-{p_mot}")
+
+@st.cache_resource
+def get_pdf_content_pack():
+    # The profiles as written into PDFs: normalized for the PDF font once per process (pdf_fonts.py).
+    return pdf_text((COMM_PROFILES, MOTIVATION_PROFILES, INTEGRATED_PROFILES))
+
+def _pdf_fragment_builder(p_comm, p_mot, role_key):
+    results = {'primaryComm': p_comm, 'primaryMotiv': p_mot}
+    return lambda: build_pdf_template(
+        new_report_pdf, draw_pdf_header,
+        lambda pdf: draw_pdf_body(pdf, results, *_profiles_for(p_comm, p_mot, get_pdf_content_pack()), role_key),
+        {'name': '', 'role': ''},
+    )
+
+def _html_fragment_builder(p_comm, p_mot):
+    results = {'primaryComm': p_comm, 'primaryMotiv': p_mot}
+    return lambda: generate_html_report({'name': HTML_NAME_SLOT}, results, *_profiles_for(p_comm, p_mot), None, None)
+
+@st.cache_resource
+def get_report_fragments():
+    """Process-wide fragment store, warmed in the background with every combination."""
+    store = FragmentStore(data_path("report_fragments"), REPORT_CONTENT_VERSION)
+    jobs = []
+    for p_comm in COMM_PROFILES:
+        for p_mot in MOTIVATION_PROFILES:
+            jobs.append(("html", (p_comm, p_mot), _html_fragment_builder(p_comm, p_mot)))
+            for role_key in ROLE_RELATIONSHIP_LABELS:
+                jobs.append(("pdf", (p_comm, p_mot, role_key), _pdf_fragment_builder(p_comm, p_mot, role_key)))
+    store.warm(jobs)
+    return store
+
+def get_report_pdf(cache_key, user_info, results):
+    """PDF bytes for a result, built once per cache_key (see report_cache_key) and kept in
+    the on-disk artifact cache rather than in memory."""
+    def build():
+        combo = (results['primaryComm'], results['primaryMotiv'], normalize_role_key(user_info['role']))
+        template = get_report_fragments().get("pdf", combo, _pdf_fragment_builder(*combo))
+        return personalize_pdf(template, draw_pdf_header, user_info)
+    return get_artifact_store().get_or_create(f"report-{cache_key}", build)
+
+@st.cache_data(max_entries=1000, ttl=24 * 3600, show_spinner=False)
+def get_report_html(cache_key, _user_info, _results):
+    combo = (_results['primaryComm'], _results['primaryMotiv'])
+    return get_report_fragments().get("html", combo, _html_fragment_builder(*combo)).replace(HTML_NAME_SLOT, str(_user_info['name']))
 
 # --- 5. UI HELPERS ---
 def show_brand_header(subtitle):
@@ -1388,6 +1281,10 @@ def show_brand_header(subtitle):
         """, unsafe_allow_html=True)
     st.markdown("<hr>", unsafe_allow_html=True)
 
+def show_resume_hint():
+    if st.session_state.get('resume_token'):
+        st.caption(f"Progress is saved after each page. If you get disconnected, reopen this link or use resume code **{st.session_state.resume_token}** with your email.")
+
 def draw_score_bar(label, value, max_value=30):
     pct = (value / max_value) * 100
     st.markdown(f"""
@@ -1402,6 +1299,133 @@ def draw_score_bar(label, value, max_value=30):
     </div>
     """, unsafe_allow_html=True)
 
+def render_question(prefix, number, q):
+    """Draw one assessment item inside the current form and return the selected answer."""
+    qtype = q.get("type", "likert")
+    with st.container(border=True):
+        # Burnout context items: keep them visually distinct
+        if q.get("style") == "Context":
+            st.markdown(f"<div class='question-text'>{number}. {q['text']}</div>", unsafe_allow_html=True)
+            st.caption("Context check: this does not change your style/driver; it helps supervisors interpret support needs.")
+            return st.radio(
+                f"{prefix}_{q['id']}",
+                options=LIKERT_OPTIONS,
+                horizontal=True,
+                index=None,
+                key=f"{prefix}_{q['id']}",
+                label_visibility="collapsed",
+            )
+
+        # --- Forced-choice (tradeoff / priority check) ---
+        if qtype == "forced":
+            default_prompt = 'Which is more like you most days?' if prefix == "c" else 'Pick what fits best.'
+            st.markdown(f"<div class='question-text'>{number}. {q.get('prompt', default_prompt)}</div>", unsafe_allow_html=True)
+            return st.radio(
+                f"{prefix}_{q['id']}",
+                options=["A", "B"],
+                index=None,
+                key=f"{prefix}_{q['id']}",
+                format_func=lambda x: q["a_text"] if x == "A" else q["b_text"],
+                label_visibility="collapsed",
+            )
+
+        # --- Likert (behavior frequency / most days) ---
+        col_q, col_a = st.columns([0.45, 0.55], gap="medium")
+        with col_q:
+            st.markdown(
+                f"<div class='question-text' style='height:100%;'>{number}. {q['text']}</div>",
+                unsafe_allow_html=True,
+            )
+
+        with col_a:
+            st.markdown(
+                """
+                <div class="scale-labels">
+                    <span>Strongly Disagree</span>
+                    <span>Strongly Agree</span>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+            return st.radio(
+                f"{prefix}_{q['id']}",
+                options=LIKERT_OPTIONS,
+                horizontal=True,
+                index=None,
+                key=f"{prefix}_{q['id']}",
+                label_visibility="collapsed",
+            )
+
+# Full-length mode is paged too, so each page's answers are checkpointed as soon as it is
+# submitted: a dropped connection loses at most one page instead of a whole section.
+FULL_PAGE_SIZE = 8
+
+def run_full_page(part, instructions, finish_label):
+    """Full-length mode: every item in bank order, a page at a time, then the next step."""
+    order = question_order(st.session_state.order_seed)[0 if part == 'comm' else 1]
+    answers_key = 'answers_comm' if part == 'comm' else 'answers_motiv'
+    done = st.session_state.get(answers_key) or {}
+    remaining = [q for q in order if q['id'] not in done]
+    if not remaining:
+        st.session_state.step = 'motiv' if part == 'comm' else 'processing'
+        st.rerun()
+    page = remaining[:FULL_PAGE_SIZE]
+    last_page = len(page) == len(remaining)
+
+    base = 0 if part == 'comm' else 50
+    st.progress(base + min(49, int(50 * len(done) / len(order))))
+    st.markdown(instructions)
+    with st.form(f"{part}_full_{len(done)}"):
+        answers = {q['id']: render_question(part[0], len(done) + i + 1, q) for i, q in enumerate(page)}
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.form_submit_button(finish_label if last_page else "Continue →"):
+            missed = [qid for qid, v in answers.items() if v is None]
+            if missed:
+                st.error(f"Please answer all questions. You missed {len(missed)} questions.")
+            else:
+                st.session_state[answers_key] = {**done, **answers}
+                if last_page:
+                    st.session_state.step = 'motiv' if part == 'comm' else 'processing'
+                checkpoint_session(st.session_state)
+                st.rerun()
+
+def run_adaptive_page(part):
+    """Adaptive mode: show the next small page of items until the primary result is settled.
+
+    Running scores live in session state and only the submitted page is scored
+    (scoring.CompiledSection.add_page). Burnout context items are always asked.
+    """
+    section = SCORING_ENGINE.comm if part == 'comm' else SCORING_ENGINE.motiv
+    order = question_order(st.session_state.order_seed)[0 if part == 'comm' else 1]
+    answers_key = 'answers_comm' if part == 'comm' else 'answers_motiv'
+    if f'adaptive_{part}' not in st.session_state:
+        st.session_state[f'adaptive_{part}'] = section.new_running()
+    running = st.session_state[f'adaptive_{part}']
+
+    answered = set(running['answered'])
+    if section.settled(running):
+        page = [q for q in order if q.get('style') == 'Context' and q['id'] not in answered]
+    else:
+        page = [q for q in order if q.get('style') != 'Context' and q['id'] not in answered][:ADAPTIVE_PAGE_SIZE]
+    if not page:
+        st.session_state.step = 'motiv' if part == 'comm' else 'processing'
+        st.rerun()
+
+    base = 0 if part == 'comm' else 50
+    st.progress(base + min(49, int(50 * len(answered) / len(order))))
+    st.markdown("**Instructions:** Choose how strongly each statement fits you most days. This short version ends as soon as your profile is clear.")
+    with st.form(f"{part}_page_{len(answered)}"):
+        answers = {q['id']: render_question(part[0], len(answered) + i + 1, q) for i, q in enumerate(page)}
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.form_submit_button("Continue →"):
+            if any(v is None for v in answers.values()):
+                st.error("Please answer every question on this page.")
+            else:
+                st.session_state[answers_key] = {**st.session_state[answers_key], **answers}
+                section.add_page(running, answers)
+                checkpoint_session(st.session_state)
+                st.rerun()
+
 # --- 6. APP LOGIC ---
 
 # Function to scroll to top
@@ -1422,16 +1446,30 @@ def scroll_to_top():
     """
     components.html(js, height=0)
 
+# Starts (once per process) the outbox worker, so submissions queued before a restart are delivered.
+get_outbox()
+# Starts (once per process) the roster sync that keeps result recovery a local lookup.
+get_result_index()
+# Starts (once per process) rendering every report body in the background.
+get_report_fragments()
+
 if 'step' not in st.session_state:
     st.session_state.step = 'intro'
-    comm_q, motiv_q = COMM_QUESTIONS.copy(), MOTIVATION_QUESTIONS.copy()
-    random.shuffle(comm_q); random.shuffle(motiv_q)
-    st.session_state.shuffled_comm = comm_q
-    st.session_state.shuffled_motiv = motiv_q
+    # Only the seed is kept per session; questions are resolved from the shared bank.
+    st.session_state.order_seed = new_order_seed()
     st.session_state.answers_comm = {}
     st.session_state.answers_motiv = {}
     st.session_state.user_info = {}
 
+    # Reopened tab after a dropped connection: pick up a checkpointed assessment from the URL.
+    resume_token = st.query_params.get("resume")
+    if resume_token:
+        saved = get_progress_store().load(resume_token)
+        if saved and saved.get('step') in RESUMABLE_STEPS:
+            restore_session(st.session_state, resume_token.strip().upper(), saved)
+        else:
+            del st.query_params["resume"]
+
 # --- INTRO ---
 if st.session_state.step == 'intro':
     # Force scroll to top on load (optional, but good practice)
@@ -1473,6 +1511,8 @@ if st.session_state.step == 'intro':
         prog_options = ["Building 10", "Cottage 2", "Cottage 3", "Cottage 7", "Cottage 8", "Cottage 9", "Cottage 11", "Euclid", "Overnight", "Skeele Valley", "TSS Staff"]
         cottage = c4.selectbox("Home Program", prog_options, index=None, placeholder="Select your program...")
 
+        adaptive = st.toggle("Short version", help="Questions come a few at a time and the assessment ends as soon as your profile is clear. Good for phones.")
+
         st.markdown("<br>", unsafe_allow_html=True)
         if st.form_submit_button("Start Assessment →"):
             if not name or not email or not role or not cottage: 
@@ -1488,11 +1528,29 @@ if st.session_state.step == 'intro':
                         st.stop()
 
                 st.session_state.user_info = {"name": name, "email": email, "role": final_role, "cottage": cottage}
+                st.session_state.adaptive = adaptive
                 st.session_state.step = 'comm'
+                st.session_state.submission_id = uuid.uuid4().hex
+                st.session_state.resume_token = new_resume_token()
+                st.query_params["resume"] = st.session_state.resume_token
+                checkpoint_session(st.session_state)
                 st.rerun()
     
     st.markdown("<br>", unsafe_allow_html=True)
 
+    # --- RESUME SECTION ---
+    with st.expander("Started earlier and got disconnected? Resume where you left off"):
+        res_email = st.text_input("Email you started with", key="resume_email_input")
+        res_code = st.text_input("Resume code", key="resume_code_input", placeholder="e.g. K7QM2XRA")
+        if st.button("Resume"):
+            saved = get_progress_store().load(res_code, email=res_email)
+            if saved and saved.get('step') in RESUMABLE_STEPS:
+                restore_session(st.session_state, res_code.strip().upper(), saved)
+                st.query_params["resume"] = st.session_state.resume_token
+                st.rerun()
+            else:
+                st.error("No unfinished assessment matches that email and code.")
+
     # --- RECOVERY SECTION (NEW) ---
     with st.expander("Already took the assessment? Recover your results"):
         st.info("Enter your email to receive a verification code and retrieve your past results.")
@@ -1522,7 +1580,7 @@ if st.session_state.step == 'intro':
             if st.button("Verify & Load"):
                 if entered_code == st.session_state.recovery_code:
                     with st.spinner("Fetching your results..."):
-                        data = fetch_user_data(st.session_state.recovery_email)
+                        data = recover_results(st.session_state.recovery_email)
                         if data and data.get("found"):
                             # Hydrate session state with fetched data
                             fetched_user = data.get("user_info")
@@ -1566,213 +1624,31 @@ if st.session_state.step == 'intro':
 elif st.session_state.step == 'comm':
     scroll_to_top()
     show_brand_header("Part 1: Communication")
-    st.progress(33)
-    st.markdown("**Instructions:** Choose how strongly each statement fits you most days.")
-    
-    with st.form("comm_form"):
-        answers = {}
-        for i, q in enumerate(st.session_state.shuffled_comm):
-            with st.container(border=True):
-                qtype = q.get("type", "likert")
-
-                # --- Forced-choice (tradeoff / priority check) ---
-                if qtype == "forced":
-                    st.markdown(f"<div class='question-text'>{i+1}. {q.get('prompt','Which is more like you most days?')}</div>", unsafe_allow_html=True)
-                    answers[q["id"]] = st.radio(
-                        f"c_{q['id']}",
-                        options=["A", "B"],
-                        index=None,
-                        key=f"c_{q['id']}",
-                        format_func=lambda x: q["a_text"] if x == "A" else q["b_text"],
-                        label_visibility="collapsed",
-                    )
-
-                # --- Likert (behavior frequency / most days) ---
-                else:
-                    col_q, col_a = st.columns([0.45, 0.55], gap="medium")
-                    with col_q:
-                        st.markdown(
-                            f"<div class='question-text' style='height:100%;'>{i+1}. {q['text']}</div>",
-                            unsafe_allow_html=True,
-                        )
-
-                    with col_a:
-                        st.markdown(
-                            """
-                            <div class="scale-labels">
-                                <span>Strongly Disagree</span>
-                                <span>Strongly Agree</span>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-                        answers[q["id"]] = st.radio(
-                            f"c_{q['id']}",
-                            options=LIKERT_OPTIONS,
-                            horizontal=True,
-                            index=None,
-                            key=f"c_{q['id']}",
-                            label_visibility="collapsed",
-                        )
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Validation Logic
-        if st.form_submit_button("Continue to Motivation →"):
-            missed = [q['id'] for q in st.session_state.shuffled_comm if answers.get(q['id']) is None]
-            if missed:
-                st.error(f"Please answer all questions. You missed {len(missed)} questions.")
-            else:
-                st.session_state.answers_comm = answers
-                st.session_state.step = 'motiv'
-                st.rerun()
+    show_resume_hint()
+    if st.session_state.get('adaptive'):
+        run_adaptive_page('comm')
+        st.stop()
+    run_full_page('comm', "**Instructions:** Choose how strongly each statement fits you most days.", "Continue to Motivation →")
 
 # --- MOTIV ---
 elif st.session_state.step == 'motiv':
     scroll_to_top()
     show_brand_header("Part 2: Motivation")
-    st.progress(66)
-    st.markdown("**Instructions:** Focus on what keeps you engaged or drains you.")
-
-    with st.form("motiv_form"):
-        answers = {}
-        for i, q in enumerate(st.session_state.shuffled_motiv):
-            with st.container(border=True):
-                qtype = q.get("type", "likert")
-
-                # Burnout context items: keep them visually distinct
-                if q.get("style") == "Context":
-                    st.markdown(f"<div class='question-text'>{i+1}. {q['text']}</div>", unsafe_allow_html=True)
-                    st.caption("Context check: this does not change your style/driver; it helps supervisors interpret support needs.")
-                    answers[q["id"]] = st.radio(
-                        f"m_{q['id']}",
-                        options=LIKERT_OPTIONS,
-                        horizontal=True,
-                        index=None,
-                        key=f"m_{q['id']}",
-                        label_visibility="collapsed",
-                    )
-                    continue
-
-                # --- Forced-choice (priority check) ---
-                if qtype == "forced":
-                    st.markdown(f"<div class='question-text'>{i+1}. {q.get('prompt','Pick what fits best.')}</div>", unsafe_allow_html=True)
-                    answers[q["id"]] = st.radio(
-                        f"m_{q['id']}",
-                        options=["A", "B"],
-                        index=None,
-                        key=f"m_{q['id']}",
-                        format_func=lambda x: q["a_text"] if x == "A" else q["b_text"],
-                        label_visibility="collapsed",
-                    )
-
-                # --- Likert ---
-                else:
-                    col_q, col_a = st.columns([0.45, 0.55], gap="medium")
-                    with col_q:
-                        st.markdown(
-                            f"<div class='question-text' style='height:100%;'>{i+1}. {q['text']}</div>",
-                            unsafe_allow_html=True,
-                        )
-
-                    with col_a:
-                        st.markdown(
-                            """
-                            <div class="scale-labels">
-                                <span>Strongly Disagree</span>
-                                <span>Strongly Agree</span>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-                        answers[q["id"]] = st.radio(
-                            f"m_{q['id']}",
-                            options=LIKERT_OPTIONS,
-                            horizontal=True,
-                            index=None,
-                            key=f"m_{q['id']}",
-                            label_visibility="collapsed",
-                        )
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Validation Logic
-        if st.form_submit_button("Complete & View Profile →"):
-            missed = [q['id'] for q in st.session_state.shuffled_motiv if answers.get(q['id']) is None]
-            if missed:
-                st.error(f"Please answer all questions. You missed {len(missed)} questions.")
-            else:
-                st.session_state.answers_motiv = answers
-                st.session_state.step = 'processing'
-                st.rerun()
+    show_resume_hint()
+    if st.session_state.get('adaptive'):
+        run_adaptive_page('motiv')
+        st.stop()
+    run_full_page('motiv', "**Instructions:** Focus on what keeps you engaged or drains you.", "Complete & View Profile →")
 
 # --- PROCESSING ---
 elif st.session_state.step == 'processing':
     scroll_to_top()
     
-        # Calculate Scores (Hybrid: Likert + Forced-choice)
-    def calculate_points(raw_score, is_reverse=False):
-        # kept for backward-compatibility; optimized items are mostly positively keyed
-        if is_reverse:
-            return 6 - raw_score
-        return raw_score
-
-    c_scores = {k: 0.0 for k in COMM_PROFILES}
-    m_scores = {k: 0.0 for k in MOTIVATION_PROFILES}
-    burnout_items = []
-
-    # --- Communication scoring ---
-    for q in COMM_QUESTIONS:
-        raw_val = st.session_state.answers_comm.get(q["id"])
-        qtype = q.get("type", "likert")
-        weight = float(q.get("weight", LIKERT_WEIGHT))
-
-        if qtype == "forced":
-            # raw_val is "A" or "B"
-            if raw_val == "A":
-                c_scores[q["a_style"]] += FORCED_WEIGHT
-            elif raw_val == "B":
-                c_scores[q["b_style"]] += FORCED_WEIGHT
-            continue
-
-        # Likert
-        points = calculate_points(int(raw_val), q.get("reverse", False)) * weight
-        c_scores[q["style"]] += points
-
-    # --- Motivation scoring ---
-    for q in MOTIVATION_QUESTIONS:
-        raw_val = st.session_state.answers_motiv.get(q["id"])
-        qtype = q.get("type", "likert")
-
-        # Burnout context is stored separately
-        if q.get("style") == "Context":
-            if raw_val is not None:
-                burnout_items.append(int(raw_val))
-            continue
-
-        if qtype == "forced":
-            if raw_val == "A":
-                m_scores[q["a_style"]] += FORCED_WEIGHT
-            elif raw_val == "B":
-                m_scores[q["b_style"]] += FORCED_WEIGHT
-            continue
-
-        points = calculate_points(int(raw_val), q.get("reverse", False)) * float(q.get("weight", LIKERT_WEIGHT))
-        m_scores[q["style"]] += points
-
-    # Normalize burnout into a 1–5 average
-    burnout_score = round(sum(burnout_items) / len(burnout_items), 2) if burnout_items else None
-
-    p_comm, s_comm = get_top_two(c_scores)
-    p_mot, s_mot = get_top_two(m_scores)
-
-    st.session_state.results = {
-        "primaryComm": p_comm,
-        "secondaryComm": s_comm,
-        "primaryMotiv": p_mot,
-        "secondaryMotiv": s_mot,
-        "commScores": c_scores,
-        "motivScores": m_scores,
-        "burnoutScore": burnout_score,
-    }
+    # Calculate Scores (Hybrid: Likert + Forced-choice), see scoring.py
+    if st.session_state.get('adaptive'):
+        st.session_state.results = SCORING_ENGINE.score_adaptive(st.session_state.adaptive_comm, st.session_state.adaptive_motiv, st.session_state.answers_motiv)
+    else:
+        st.session_state.results = SCORING_ENGINE.score(st.session_state.answers_comm, st.session_state.answers_motiv)
     
     # Logic to clean cottage name (remove "Cottage " prefix)
     raw_cottage = st.session_state.user_info['cottage']
@@ -1788,11 +1664,19 @@ elif st.session_state.step == 'processing':
         "cottage": clean_cottage,  # Use cleaned version
         "scores": st.session_state.results,
         "answers": flat_answers,
+        "order_seed": st.session_state.get('order_seed'),  # reproduces the item order for analysis
+        "bank_version": QUESTION_BANK_VERSION,
     }
     
-    with st.spinner("Analyzing results..."):
-        submit_to_google_sheets(payload, action="save")
-        time.sleep(1.0)
+    # Recorded durably on disk; the outbox worker delivers it to Google with retries.
+    # The id is fixed per session so a repeated rerun cannot queue the same result twice.
+    if 'submission_id' not in st.session_state:
+        st.session_state.submission_id = uuid.uuid4().hex
+    get_outbox().enqueue(payload, key=st.session_state.submission_id)
+    get_result_index().record(payload)
+    if st.session_state.get('resume_token'):
+        get_progress_store().delete(st.session_state.resume_token)
+        st.query_params.pop("resume", None)
     
     st.session_state.step = 'results'
     st.rerun()
@@ -1828,17 +1712,18 @@ elif st.session_state.step == 'results':
     # --- ACTION BAR ---
     c1, c2 = st.columns(2)
     with c1:
-        pdf_bytes = create_pdf(user, res, comm_prof, mot_prof, int_prof, role_key, role_labels)
+        # Built lazily on the first click and kept in the artifact cache, so reruns of this page skip FPDF entirely.
+        report_key = report_cache_key(user, res)
         
         # Create dynamic filename
         clean_name = user['name'].strip().replace(" ", "_").lower()
         file_name_str = f"{clean_name}_compass.pdf"
         
-        st.download_button("📄 Download PDF Report", data=pdf_bytes, file_name=file_name_str, mime="application/pdf")
+        st.download_button("📄 Download PDF Report", data=lambda: get_report_pdf(report_key, user, res), file_name=file_name_str, mime="application/pdf")
     with c2:
         if st.button("📧 Email Me Full Report"):
             # [CHANGE] Now calls the HTML generator function
-            full_html = generate_html_report(user, res, comm_prof, mot_prof, int_prof, role_key, role_labels)
+            full_html = get_report_html(report_key, user, res)
             with st.spinner("Sending..."):
                 if send_email_via_smtp(user['email'], "Your Elmcrest Leadership Compass Profile", full_html):
                     st.success("Sent!")
@@ -1853,22 +1738,29 @@ elif st.session_state.step == 'results':
         with vc1:
             # 1. COMMUNICATION RADAR
             # Use real scores from the assessment results
-            radar_df = pd.DataFrame(dict(r=list(res['commScores'].values()), theta=list(res['commScores'].keys())))
-            fig_comm = px.line_polar(radar_df, r='r', theta='theta', line_close=True, title="Communication Footprint", range_r=[0,30])
-            fig_comm.update_traces(fill='toself', line_color=BRAND_COLORS['blue'])
-            fig_comm.update_layout(height=300, margin=dict(t=30, b=30, l=30, r=30))
-            st.plotly_chart(fig_comm, use_container_width=True)
+            # (records recovered from the roster may only carry primary/secondary labels)
+            if res.get('commScores'):
+                radar_df = pd.DataFrame(dict(r=list(res['commScores'].values()), theta=list(res['commScores'].keys())))
+                fig_comm = px.line_polar(radar_df, r='r', theta='theta', line_close=True, title="Communication Footprint", range_r=[0,30])
+                fig_comm.update_traces(fill='toself', line_color=BRAND_COLORS['blue'])
+                fig_comm.update_layout(height=300, margin=dict(t=30, b=30, l=30, r=30))
+                st.plotly_chart(fig_comm, use_container_width=True)
+            else:
+                st.caption("Detailed communication scores are not available for this record.")
             
         with vc2:
             # 2. MOTIVATION BATTERY
             # Use real scores from the assessment results
-            sorted_mot = dict(sorted(res['motivScores'].items(), key=lambda item: item[1], reverse=True))
-            mot_df = pd.DataFrame(dict(Driver=list(sorted_mot.keys()), Intensity=list(sorted_mot.values())))
-            
-            fig_mot = px.bar(mot_df, x="Intensity", y="Driver", orientation='h', title="Motivation Drivers", color="Intensity", color_continuous_scale=[BRAND_COLORS['gray'], BRAND_COLORS['blue']])
-            fig_mot.update_layout(height=300, showlegend=False, margin=dict(t=30, b=30, l=30, r=30))
-            fig_mot.update_xaxes(visible=False)
-            st.plotly_chart(fig_mot, use_container_width=True)
+            if res.get('motivScores'):
+                sorted_mot = dict(sorted(res['motivScores'].items(), key=lambda item: item[1], reverse=True))
+                mot_df = pd.DataFrame(dict(Driver=list(sorted_mot.keys()), Intensity=list(sorted_mot.values())))
+                
+                fig_mot = px.bar(mot_df, x="Intensity", y="Driver", orientation='h', title="Motivation Drivers", color="Intensity", color_continuous_scale=[BRAND_COLORS['gray'], BRAND_COLORS['blue']])
+                fig_mot.update_layout(height=300, showlegend=False, margin=dict(t=30, b=30, l=30, r=30))
+                fig_mot.update_xaxes(visible=False)
+                st.plotly_chart(fig_mot, use_container_width=True)
+            else:
+                st.caption("Detailed motivation scores are not available for this record.")
 
     # --- [NEW] CHEAT SHEET SECTION ---
     with st.expander("⚡ Rapid Interaction Cheat Sheet (How others experience you)", expanded=True):
@@ -0,0 +1,127 @@
+"""Disk-backed cache for generated files (PDF guides, reports, ZIP exports).
+
+Sessions used to hold every PDF they generated in ``st.session_state`` for the
+life of the session. Generated bytes now go into an ``ArtifactStore`` and the
+session keeps only the artifact key; download buttons read the bytes back when
+clicked. By default keys are the SHA-256 of the content, so identical files are
+stored once; callers that can name a file before building it (the participant
+report, keyed by report_cache_key) pass their own key to ``get_or_create``.
+
+The store is bounded by total size: every read refreshes a file's mtime, and
+when a write pushes the directory over ``max_bytes`` the least recently used
+files are deleted. Several server processes can share one directory.
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+
+import streamlit as st
+
+from config import data_path
+
+log = logging.getLogger(__name__)
+
+# Total on-disk budget. Override with COMPASS_ARTIFACT_CACHE_MB.
+ARTIFACT_CACHE_BYTES = int(os.environ.get("COMPASS_ARTIFACT_CACHE_MB", "256")) * 1024 * 1024
+
+_KEY_RE = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+
+class ArtifactStore:
+    def __init__(self, directory, max_bytes=ARTIFACT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(size for _, _, size in self._entries())
+
+    def _path(self, key):
+        if not _KEY_RE.match(str(key or "")):
+            raise ValueError(f"Invalid artifact key: {key!r}")
+        return os.path.join(self.directory, key)
+
+    def _entries(self):
+        """(path, mtime, size) for every stored artifact."""
+        out = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                info = entry.stat()
+            except FileNotFoundError:
+                continue
+            out.append((entry.path, info.st_mtime, info.st_size))
+        return out
+
+    def put(self, data, key=None):
+        """Store ``data`` and return its key (the content hash unless ``key`` is given)."""
+        data = bytes(data)
+        key = key or hashlib.sha256(data).hexdigest()
+        path = self._path(key)
+        if os.path.exists(path):
+            self._touch(path)
+            return key
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+        return key
+
+    def get(self, key):
+        """The stored bytes, or None if ``key`` was never stored or has been evicted."""
+        if not key:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self._touch(path)
+        return data
+
+    def has(self, key):
+        return bool(key) and os.path.exists(self._path(key))
+
+    def get_or_create(self, key, build):
+        """Bytes for ``key``, calling ``build()`` and storing the result on a miss."""
+        data = self.get(key)
+        if data is None:
+            data = bytes(build())
+            self.put(data, key=key)
+        return data
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        # Rescan rather than trust the running total: other processes write here too.
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9   # evict a little extra so we don't rescan on every write
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                total -= size
+            except OSError as e:
+                log.warning("Could not evict artifact %s: %s", path, e)
+        self._size = total
+
+
+@st.cache_resource
+def get_artifact_store():
+    return ArtifactStore(data_path("artifacts"))
@@ -0,0 +1,39 @@
+"""Shared settings for the Compass app and supervisor portal."""
+import os
+
+# Local working files (roster snapshot, outbox, caches). Override with
+# COMPASS_DATA_DIR when the app directory is read-only.
+DATA_DIR = os.environ.get(
+    "COMPASS_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".compass_data"),
+)
+
+
+def data_path(*parts):
+    """Absolute path inside DATA_DIR, creating the directory on first use."""
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+# Apps Script web app that fronts the Google Sheet (used by the apps_script backend).
+GOOGLE_SCRIPT_URL = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+
+# Where results and the roster live: "apps_script" (Google Sheet) or "sqlite" (local).
+STORAGE_BACKEND = os.environ.get("COMPASS_STORAGE", "apps_script")
+
+# The deployed Apps Script must handle {"action": "saveBatch", "rows": [...]} and reply
+# {"saved": <count>} before this is turned on (COMPASS_APPS_SCRIPT_BATCH_SAVE=1). Until
+# then batches are written one `save` request per row.
+APPS_SCRIPT_BATCH_SAVE = os.environ.get("COMPASS_APPS_SCRIPT_BATCH_SAVE", "") == "1"
+
+# Rescoring and item analysis need the script to handle "listAnswers" (reply {"rows": [...],
+# "cursor": ..., "done": bool}) and "updateScores" (reply {"updated": <count>}). The deployed
+# script doesn't yet, so they stay off for apps_script until COMPASS_APPS_SCRIPT_RESCORE=1.
+APPS_SCRIPT_RESCORE = os.environ.get("COMPASS_APPS_SCRIPT_RESCORE", "") == "1"
+
+# Worker processes for bulk guide exports (see guide_export.py); 1 renders on the job thread.
+GUIDE_EXPORT_WORKERS = int(os.environ.get("COMPASS_GUIDE_EXPORT_WORKERS") or min(4, os.cpu_count() or 1))
+
+# Timezone the sheet writes its (naive) timestamps in, e.g. "America/New_York". Unset means
+# the server's local time, which is right when the app and the Apps Script share a zone.
+SHEET_TIMEZONE = os.environ.get("COMPASS_SHEET_TIMEZONE") or None
@@ -0,0 +1,111 @@
+"""Bulk export of Supervisor's Guides into a single ZIP.
+
+The portal runs the export as one job on the background runner (jobs.py), so
+the page stays responsive and a repeated click for the same staff list reuses
+the running or finished export. Even with fonts, subsets and chart images
+cached per process (pdf_fonts.py, report_charts.py) a guide takes roughly
+90-200 ms, nearly all of it FPDF laying out text in pure Python, so a
+60-person cottage is 6-12 s on one core.
+
+Exports of more than a handful of guides are therefore spread over a pool of
+``GUIDE_EXPORT_WORKERS`` processes. The pool uses the spawn start method,
+because forking the threaded Streamlit server can hand workers locks that are
+never released; spawned workers import supervisor_guide.py on their own. They
+take a second or two to start, so the pool is created on the first large
+export and kept for later ones.
+"""
+import multiprocessing
+import re
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import GUIDE_EXPORT_WORKERS
+
+GUIDE_FIELDS = ("name", "role", "p_comm", "s_comm", "p_mot", "s_mot")
+
+# Below this many guides, starting or waking the pool costs more than it saves.
+POOL_MIN_GUIDES = 8
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def guide_filename(name):
+    """Same naming as the single-guide download, minus characters a ZIP entry can't carry."""
+    return "Guide_" + re.sub(r"[^\w.-]", "", str(name).replace(" ", "_")) + ".pdf"
+
+
+def _get_pool(workers):
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool):
+    # A worker died (e.g. out of memory); the next export starts a fresh pool.
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _rendered(jobs, render, workers):
+    """Yield ``render(*args)`` (or the exception it raised) for each job, in order."""
+    if workers <= 1 or len(jobs) < POOL_MIN_GUIDES:
+        for args in jobs:
+            try:
+                yield render(*args)
+            except Exception as e:
+                yield e
+        return
+    pool = _get_pool(workers)
+    futures = [pool.submit(render, *args) for args in jobs]
+    try:
+        for future in futures:
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                _discard_pool(pool)
+                yield e
+            except Exception as e:
+                yield e
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def export_guides(rows, render, out, on_progress=None, workers=GUIDE_EXPORT_WORKERS):
+    """Render a guide for every row dict and write each into the ZIP file object ``out``
+    as soon as it finishes. ``on_progress(done, total)`` is called after each guide.
+
+    ``render`` must be importable from a module (not defined in a page script) so
+    worker processes can load it.
+
+    Returns ``(written, failures)`` where failures is a list of ``(name, error)``.
+    """
+    jobs = [tuple(row.get(k) for k in GUIDE_FIELDS) for row in rows]
+    total, written, failures, used = len(jobs), 0, [], set()
+
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for done, (args, result) in enumerate(zip(jobs, _rendered(jobs, render, workers)), 1):
+            name = args[0]
+            if not isinstance(result, Exception) and not result:
+                result = ValueError("PDF generator returned no data.")
+            if isinstance(result, Exception):
+                failures.append((name, str(result)))
+            else:
+                fname, n = guide_filename(name), 1
+                while fname in used:
+                    n += 1
+                    fname = guide_filename(f"{name} {n}")
+                used.add(fname)
+                zf.writestr(fname, bytes(result))
+                written += 1
+            if on_progress:
+                on_progress(done, total)
+    return written, failures
@@ -0,0 +1,119 @@
+"""Process-wide pooled HTTP client for Apps Script and Gemini calls.
+
+Each bare ``requests.post``/``requests.get`` opened a fresh TLS connection to
+script.google.com, and several calls had no timeout at all. ``ApiClient`` wraps
+one ``requests.Session`` with keep-alive pools and applies a named policy per
+endpoint (timeouts, which statuses to retry, backoff), while counting calls,
+errors and latency so slow dependencies are visible in the portal.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    timeout: tuple = (5, 20)    # (connect, read) seconds
+    retries: int = 0            # extra attempts after the first
+    backoff: float = 1.0        # seconds, doubled per attempt
+    retry_statuses: tuple = RETRY_STATUSES
+
+
+ENDPOINT_POLICIES = {
+    # Roster download: safe to repeat.
+    "apps_script.read": EndpointPolicy(timeout=(5, 20), retries=2),
+    # Email lookup for result recovery: the user is waiting, keep it short.
+    "apps_script.lookup": EndpointPolicy(timeout=(5, 10), retries=1),
+    # Saves are not retried here; the outbox retries them with idempotency keys.
+    "apps_script.write": EndpointPolicy(timeout=(5, 15), retries=0),
+    # Gemini returns 503 when overloaded; back off 2s, 4s, 8s.
+    "gemini": EndpointPolicy(timeout=(5, 60), retries=3, backoff=2.0, retry_statuses=(429, 503)),
+}
+
+
+class EndpointStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_seconds = 0.0
+        self.last_error = None
+
+    def as_dict(self, name):
+        return {
+            "endpoint": name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": round(1000 * self.total_seconds / self.calls) if self.calls else None,
+            "last_error": self.last_error,
+        }
+
+
+class ApiClient:
+    def __init__(self, policies=None, pool_size=10):
+        self.policies = dict(ENDPOINT_POLICIES, **(policies or {}))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _record(self, endpoint, seconds, error=None, retried=False):
+        with self._lock:
+            s = self._stats.setdefault(endpoint, EndpointStats())
+            s.calls += 1
+            s.total_seconds += seconds
+            if retried:
+                s.retries += 1
+            if error:
+                s.errors += 1
+                s.last_error = error
+
+    def request(self, endpoint, method, url, **kwargs):
+        """Send a request under ``endpoint``'s policy and return the final Response.
+
+        Retryable statuses and connection errors are retried with exponential
+        backoff; the last response is returned (or the last exception raised)
+        once attempts run out, so callers still check ``status_code``.
+        """
+        policy = self.policies.get(endpoint, EndpointPolicy())
+        kwargs.setdefault("timeout", policy.timeout)
+        for attempt in range(policy.retries + 1):
+            last_attempt = attempt == policy.retries
+            started = time.perf_counter()
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(endpoint, time.perf_counter() - started, type(e).__name__, retried=attempt > 0)
+                if last_attempt:
+                    raise
+            else:
+                error = f"HTTP {resp.status_code}" if resp.status_code >= 400 else None
+                self._record(endpoint, time.perf_counter() - started, error, retried=attempt > 0)
+                if resp.status_code not in policy.retry_statuses or last_attempt:
+                    return resp
+            time.sleep(policy.backoff * 2 ** attempt)
+
+    def get(self, endpoint, url, **kwargs):
+        return self.request(endpoint, "GET", url, **kwargs)
+
+    def post(self, endpoint, url, **kwargs):
+        return self.request(endpoint, "POST", url, **kwargs)
+
+    def stats(self):
+        with self._lock:
+            return [s.as_dict(name) for name, s in sorted(self._stats.items())]
+
+
+@st.cache_resource
+def get_http_client():
+    """The shared client, created once per server process."""
+    return ApiClient()
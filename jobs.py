@@ -0,0 +1,103 @@
+"""Background render jobs for the supervisor portal.
+
+Rendering a Supervisor's Guide used to run inline on the script thread, which
+froze the page for the length of the render, and every re-click started the
+same render again. ``JobRunner`` runs such work on a small worker pool instead:
+
+* jobs are keyed by the caller (for guides: content version + name + profile),
+  and submitting a key that is already queued, running or finished returns
+  that job rather than starting another;
+* the page polls ``get(key)`` until the job is done;
+* finished jobs are kept (newest ``keep``) so re-opening the same guide is
+  instant. Failed jobs are not kept as results; the next submit retries.
+
+Jobs should return something small (the guide job returns an artifact key, see
+artifacts.py), since finished results stay in memory.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+log = logging.getLogger(__name__)
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+
+def job_key(kind, *parts):
+    """Stable key for a job from JSON-serializable parts."""
+    payload = json.dumps([kind, *parts], sort_keys=True, default=str)
+    return f"{kind}-" + hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class Job:
+    def __init__(self, key):
+        self.key = key
+        self.state = PENDING
+        self.result = None
+        self.error = None
+        self.progress = None   # optional (done, total) a long job reports as it goes
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.state in (DONE, FAILED)
+
+
+class JobRunner:
+    def __init__(self, max_workers=2, keep=64):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render-job")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self.keep = keep
+
+    def submit(self, key, fn, *args):
+        """The job for ``key``, starting ``fn(*args)`` only if none is queued, running or done."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.state != FAILED:
+                self._jobs.move_to_end(key)
+                return job
+            job = self._jobs[key] = Job(key)
+            self._evict()
+        self._pool.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def discard(self, key):
+        """Forget a finished job so the next submit runs it again (e.g. its output was evicted)."""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.finished:
+                del self._jobs[key]
+
+    def _run(self, job, fn, args):
+        job.state = RUNNING
+        try:
+            job.result = fn(*args)
+            job.state = DONE
+        except Exception as e:
+            log.warning("Render job %s failed: %s", job.key, e)
+            job.error = str(e)
+            job.state = FAILED
+        job.finished_at = time.time()
+
+    def _evict(self):
+        # Only finished jobs are dropped; in-flight ones must stay findable by their pollers.
+        finished = [k for k, j in self._jobs.items() if j.finished]
+        for key in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[key]
+
+
+@st.cache_resource
+def get_job_runner():
+    return JobRunner()
@@ -0,0 +1,124 @@
+"""Durable write-behind outbox for assessment submissions.
+
+Completing the assessment used to block on a synchronous Apps Script POST (up to
+15s) and a result was lost if that call failed. Submissions are now written to a
+local SQLite outbox first, which takes milliseconds, and a daemon thread drains
+the outbox to the backend with exponential backoff.
+
+Every entry carries an idempotency key that is also sent as ``submission_id``
+in the payload, so a retry after a lost response can be de-duplicated by the
+backend instead of creating a second row.
+"""
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 15 * 60
+POLL_SECONDS = 30
+
+
+class Outbox:
+    """SQLite-backed queue of payloads waiting to be delivered by ``send(payload)``.
+
+    ``send`` must raise (or return False) when delivery fails; the entry is then
+    retried later. Entries are never dropped, only delayed.
+    """
+
+    def __init__(self, path, send, poll_seconds=POLL_SECONDS):
+        self._path = path
+        self._send = send
+        self._poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._draining = threading.Lock()
+        self._thread = None
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS outbox (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(next_attempt_at)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self._path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, payload, key=None):
+        """Durably record ``payload`` and wake the worker. Returns the idempotency key."""
+        key = key or uuid.uuid4().hex
+        payload = dict(payload, submission_id=key)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO outbox (id, payload, created_at, next_attempt_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(payload), now, now),
+            )
+        self._wake.set()
+        return key
+
+    def pending_count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def drain(self):
+        """Try to deliver every entry that is due. Returns the number delivered."""
+        with self._draining:
+            with self._connect() as conn:
+                due = conn.execute(
+                    "SELECT id, payload, attempts FROM outbox WHERE next_attempt_at <= ? ORDER BY created_at",
+                    (time.time(),),
+                ).fetchall()
+            delivered = 0
+            for key, payload, attempts in due:
+                try:
+                    ok = self._send(json.loads(payload))
+                    error = None if ok is not False else "backend rejected the submission"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                with self._connect() as conn:
+                    if error is None:
+                        conn.execute("DELETE FROM outbox WHERE id = ?", (key,))
+                        delivered += 1
+                    else:
+                        delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** attempts)
+                        delay *= random.uniform(0.8, 1.2)
+                        log.warning("Outbox delivery of %s failed (attempt %d): %s", key, attempts + 1, error)
+                        conn.execute(
+                            "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                            (time.time() + delay, error, key),
+                        )
+            return delivered
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="outbox-drain", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                self.drain()
+            except Exception as e:
+                log.exception("Outbox drain crashed: %s", e)
+            self._wake.wait(self._poll_seconds)
+            self._wake.clear()
@@ -27,7 +27,7 @@ def set_view(view_name):
     st.session_state.current_view = view_name
 
 # --- 2. CONSTANTS ---
-GOOGLE_SCRIPT_URL = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+from config import GOOGLE_SCRIPT_URL
 
 BRAND_COLORS = {
     "blue": "#1a73e8",
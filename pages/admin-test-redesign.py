@@ -5,7 +5,9 @@ import pandas as pd
 import requests
 import streamlit as st
 
-DATA_URL = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+from config import GOOGLE_SCRIPT_URL
+
+DATA_URL = GOOGLE_SCRIPT_URL
 
 # --- Lightweight interpretation dictionaries (edit to match your internal language) ---
 COMM_DESC = {
@@ -1,4 +1,5 @@
 import streamlit as st
+from config import GOOGLE_SCRIPT_URL
 import random
 import requests
 import time
@@ -1026,7 +1027,7 @@ def submit_to_google_sheets(data, action="save"):
     The backend can store both summary scores and, if provided, an `answers` dict
     for per-question columns.
     """
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+    url = GOOGLE_SCRIPT_URL
     data["action"] = action
     try:
         resp = requests.post(url, json=data, timeout=15)
@@ -1041,7 +1042,7 @@ def submit_to_google_sheets(data, action="save"):
 def fetch_user_data(email):
     # Attempts to fetch data from Google Scripts
     # NOTE: Your Google Script must handle the 'retrieve' action for this to work.
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+    url = GOOGLE_SCRIPT_URL
     try:
         response = requests.post(url, json={"action": "retrieve", "email": email})
         if response.status_code == 200:
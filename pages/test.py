@@ -1,4 +1,5 @@
 import streamlit as st
+from config import GOOGLE_SCRIPT_URL
 import random
 import copy
 import requests
@@ -1033,7 +1034,7 @@ def clean_text(text):
 
 def submit_to_google_sheets(data, action="save"):
     # Sends data to Google Scripts
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+    url = GOOGLE_SCRIPT_URL
     data["action"] = action
     try:
         requests.post(url, json=data)
@@ -1045,7 +1046,7 @@ def submit_to_google_sheets(data, action="save"):
 def fetch_user_data(email):
     # Attempts to fetch data from Google Scripts
     # NOTE: Your Google Script must handle the 'retrieve' action for this to work.
-    url = "https://script.google.com/macros/s/AKfycbymKxV156gkuGKI_eyKb483W4cGORMMcWqKsFcmgHAif51xQHyOCDO4KeXPJdK4gHpD/exec"
+    url = GOOGLE_SCRIPT_URL
     try:
         response = requests.post(url, json={"action": "retrieve", "email": email})
         if response.status_code == 200:
@@ -0,0 +1,192 @@
+"""Unicode text in FPDF documents.
+
+fpdf 1.x core fonts (Arial/Helvetica/Times) only cover latin-1, so every PDF
+string used to be sanitized on each write (curly quotes and dashes replaced,
+anything else dropped). ``UnicodeFPDF`` registers DejaVu Sans (shipped with
+matplotlib) instead and maps the core family names onto it, so existing
+``set_font("Arial", ...)`` calls keep working and text is written as-is.
+
+FPDF embeds a subset of each font a document uses, and building that subset
+re-reads the TTF on every output. To keep this cheap, font metrics are parsed
+once per process, styles are registered only when first selected, and every
+subset starts from all of Latin-1. Documents with the same glyphs (nearly all
+of them: content plus a name) then produce the same subset, which is built
+once per process and reused.
+
+DejaVu has no emoji, and FPDF fails on output for characters the font lacks
+(outside the Basic Multilingual Plane it raises IndexError). ``PDF_TEXT_TABLE``
+drops every character without a glyph in the font. ``pdf_text`` applies it to a
+whole content pack (nested dicts/lists of strings) once, when the pack is
+loaded, and ``UnicodeFPDF`` applies it to all text written while a DejaVu style
+is selected, so user-typed names can't break a render either.
+"""
+import os
+import re
+from functools import lru_cache
+
+import fpdf.fpdf
+import matplotlib
+from fpdf import FPDF
+from fpdf.ttfonts import TTFontFile
+
+FONT_FAMILY = "DejaVu"
+FONT_DIR = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
+FONT_FILES = {
+    "": "DejaVuSans.ttf",
+    "B": "DejaVuSans-Bold.ttf",
+    "I": "DejaVuSans-Oblique.ttf",
+    "BI": "DejaVuSans-BoldOblique.ttf",
+}
+CORE_FAMILIES = {"arial", "helvetica", "times", "courier"}
+BASE_SUBSET = list(range(0, 256))
+
+
+class _Widths(list):
+    """Glyph widths for one style (65k entries). Pickles and deep-copies as a reference to
+    the per-process table, so cached PDF templates don't each carry their own copy."""
+
+    def __reduce__(self):
+        return _widths, (self.style,)
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _widths(style):
+    return _font_metrics(style)["cw"]
+
+
+@lru_cache(maxsize=None)
+def _font_metrics(style):
+    path = os.path.join(FONT_DIR, FONT_FILES[style])
+    ttf = TTFontFile()
+    ttf.getMetrics(path)
+    cw = _Widths(ttf.charWidths)
+    cw.style = style
+    return {
+        "name": re.sub("[ ()]", "", ttf.fullName),
+        "desc": {
+            "Ascent": int(round(ttf.ascent)),
+            "Descent": int(round(ttf.descent)),
+            "CapHeight": int(round(ttf.capHeight)),
+            "Flags": ttf.flags,
+            "FontBBox": "[%s %s %s %s]" % tuple(int(round(v)) for v in ttf.bbox),
+            "ItalicAngle": int(ttf.italicAngle),
+            "StemV": int(round(ttf.stemV)),
+            "MissingWidth": int(round(ttf.defaultWidth)),
+        },
+        "up": round(ttf.underlinePosition),
+        "ut": round(ttf.underlineThickness),
+        "cw": cw,   # shared, read-only
+        "ttffile": path,
+        "originalsize": os.stat(path).st_size,
+    }
+
+
+def add_unicode_font(pdf, style=""):
+    """Register one DejaVu style on ``pdf`` (what ``add_font(..., uni=True)`` does, minus re-parsing)."""
+    fontkey = FONT_FAMILY.lower() + style
+    if fontkey in pdf.fonts:
+        return
+    m = _font_metrics(style)
+    pdf.fonts[fontkey] = {
+        "i": len(pdf.fonts) + 1, "type": "TTF", "name": m["name"], "desc": m["desc"],
+        "up": m["up"], "ut": m["ut"], "cw": m["cw"], "ttffile": m["ttffile"],
+        "fontkey": fontkey, "subset": list(BASE_SUBSET), "unifilename": None,
+    }
+    pdf.font_files[fontkey] = {"length1": m["originalsize"], "type": "TTF", "ttffile": m["ttffile"]}
+    pdf.font_files[FONT_FILES[style]] = {"type": "TTF"}
+
+
+_width_arrays = {}
+
+
+class UnicodeFPDF(FPDF):
+    def set_font(self, family, style="", size=0):
+        if family.lower() in CORE_FAMILIES:
+            family = FONT_FAMILY
+        if family.lower() == FONT_FAMILY.lower():
+            key = "".join(c for c in "BI" if c in style.upper())
+            add_unicode_font(self, key)
+        super().set_font(family, style, size)
+
+    def normalize_text(self, txt):
+        # Every write goes through here, so callers pass raw values (None and numbers too).
+        if not isinstance(txt, str):
+            txt = "" if txt is None else str(txt)
+        if self.unifontsubset and not txt.isascii():   # ASCII is all in the font
+            txt = txt.translate(PDF_TEXT_TABLE)
+        return txt
+
+    def _putfonts(self):
+        # FPDF appends every character written to the subset list, repeats included;
+        # dedupe it so identical glyph sets give identical (cacheable) subsets.
+        for font in self.fonts.values():
+            if font.get("type") == "TTF":
+                font["subset"] = sorted(set(font["subset"]))
+        super()._putfonts()
+
+    def _putTTfontwidths(self, font, maxUni):
+        # The /W array depends only on the font and subset; FPDF rebuilds it glyph by glyph.
+        key = (font["ttffile"], maxUni, tuple(font["subset"]))
+        lines = _width_arrays.get(key)
+        if lines is None:
+            lines = []
+            self._out = lines.append
+            try:
+                super()._putTTfontwidths(font, maxUni)
+            finally:
+                del self._out
+            if len(_width_arrays) >= 64:
+                _width_arrays.clear()
+            _width_arrays[key] = lines
+        for line in lines:
+            self._out(line)
+
+
+@lru_cache(maxsize=64)
+def _subset(path, glyphs):
+    ttf = TTFontFile()
+    stream = ttf.makeSubset(path, list(glyphs))
+    return stream, ttf.codeToGlyph, ttf.maxUni
+
+
+class _SubsetCachingTTFontFile(TTFontFile):
+    # FPDF._putfonts only reads makeSubset(), codeToGlyph and maxUni, which depend on (file, subset) alone.
+    def makeSubset(self, file, subset):
+        stream, self.codeToGlyph, self.maxUni = _subset(file, tuple(subset))
+        return stream
+
+
+fpdf.fpdf.TTFontFile = _SubsetCachingTTFontFile
+
+
+class _GlyphTable(dict):
+    """``str.translate`` table that drops code points the font has no glyph for.
+
+    Filled lazily (kept characters map to themselves), so after the first sight of a
+    character translate() runs at dict speed.
+    """
+
+    def __init__(self, cw):
+        super().__init__({0x200D: None, 0xFE0E: None, 0xFE0F: None})   # ZWJ and emoji presentation selectors
+        self._cw = cw
+
+    def __missing__(self, cp):
+        keep = cp in (0x09, 0x0A, 0x0D) or (cp < len(self._cw) and self._cw[cp])   # controls have no width but break lines
+        self[cp] = cp if keep else None
+        return self[cp]
+
+
+PDF_TEXT_TABLE = _GlyphTable(_font_metrics("")["cw"])
+
+
+def pdf_text(value):
+    """``value`` (a string or nested dicts/lists/tuples of them) with PDF_TEXT_TABLE applied."""
+    if isinstance(value, str):
+        return value.translate(PDF_TEXT_TABLE)
+    if isinstance(value, dict):
+        return {k: pdf_text(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(pdf_text(v) for v in value)
+    return value
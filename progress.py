@@ -0,0 +1,99 @@
+"""Checkpoints for assessments that are still in progress.
+
+Everything a participant has answered lives in ``st.session_state``, which is
+gone when a phone sleeps or the websocket drops; they used to start over from
+the intro. The app now checkpoints the session to a local SQLite table each
+time a page of questions is submitted, keyed by a short resume token (also put
+in the page URL as ``?resume=<token>``, so simply reopening the tab restores
+it) and the participant's email (so they can type the code back in).
+
+Checkpoints are deleted when the assessment is submitted and expire after
+``PROGRESS_TTL_SECONDS`` otherwise.
+"""
+import json
+import secrets
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+from config import data_path
+
+PROGRESS_TTL_SECONDS = 14 * 24 * 3600
+
+# Session keys that make up a checkpoint (all JSON-serializable). submission_id is
+# included so a resumed submit is de-duplicated by the outbox/backends.
+PROGRESS_KEYS = (
+    "step", "user_info", "order_seed", "answers_comm", "answers_motiv",
+    "adaptive", "adaptive_comm", "adaptive_motiv", "submission_id",
+)
+RESUMABLE_STEPS = ("comm", "motiv", "processing")
+
+
+def new_resume_token():
+    """Short, URL-safe and easy to read back over the phone (no 0/O or 1/I)."""
+    alphabet = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+    return "".join(secrets.choice(alphabet) for _ in range(8))
+
+
+class ProgressStore:
+    def __init__(self, path, ttl=PROGRESS_TTL_SECONDS):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS progress (
+                    token TEXT PRIMARY KEY,
+                    email TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    state TEXT NOT NULL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_progress_updated ON progress(updated_at)")
+            self._conn.execute("DELETE FROM progress WHERE updated_at < ?", (time.time() - ttl,))
+
+    def save(self, token, email, state):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO progress (token, email, updated_at, state) VALUES (?, ?, ?, ?)",
+                (token, str(email or "").strip().lower(), time.time(), json.dumps(state)),
+            )
+
+    def load(self, token, email=None):
+        """The saved state for ``token`` (and ``email``, when given), or None."""
+        with self._lock:
+            # Expired rows are only purged at startup, so the lookup checks the age itself.
+            row = self._conn.execute(
+                "SELECT email, state FROM progress WHERE token = ? AND updated_at >= ?",
+                (str(token or "").strip().upper(), time.time() - self._ttl),
+            ).fetchone()
+        if row is None or (email is not None and row[0] != str(email).strip().lower()):
+            return None
+        return json.loads(row[1])
+
+    def delete(self, token):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM progress WHERE token = ?", (token,))
+
+
+@st.cache_resource
+def get_progress_store():
+    return ProgressStore(data_path("progress.sqlite3"))
+
+
+def checkpoint_session(session_state):
+    """Save the resumable part of ``session_state`` under its resume token."""
+    token = session_state.get("resume_token")
+    if not token:
+        return
+    state = {k: session_state[k] for k in PROGRESS_KEYS if k in session_state}
+    get_progress_store().save(token, (session_state.get("user_info") or {}).get("email"), state)
+
+
+def restore_session(session_state, token, state):
+    for key, value in state.items():
+        if key in PROGRESS_KEYS:
+            session_state[key] = value
+    session_state.resume_token = token
@@ -0,0 +1,134 @@
+"""Item analysis for the question bank: which items actually carry signal.
+
+``analyze()`` loads stored answer sets into NumPy matrices once and computes,
+in vectorized form:
+
+* per-scale reliability (Cronbach's alpha) for each style, driver and the
+  burnout context scale, over the scale's Likert items;
+* per-item mean, spread, corrected item-total correlation (the item against
+  the sum of the *other* items on its scale) and alpha if the item were dropped;
+* forced-choice selection rates (a 95/5 split tells us nothing);
+* score distributions and primary-label shares from the scoring engine.
+
+Rules of thumb when pruning: alpha below ~0.6 means a scale is not measuring
+one thing; an item-total correlation below ~0.2, or an alpha that rises when
+the item is dropped, marks an item worth rewording or removing.
+"""
+import numpy as np
+import pandas as pd
+
+from question_bank import COMM_QUESTIONS, MOTIVATION_QUESTIONS
+from scoring import ENGINE, top_two_indices
+
+MIN_RESPONDENTS = 10
+
+
+def likert_matrix(answer_sets, questions):
+    """Keyed Likert answers (respondents x items), NaN where missing."""
+    X = np.full((len(answer_sets), len(questions)), np.nan)
+    for r, answers in enumerate(answer_sets):
+        for c, q in enumerate(questions):
+            try:
+                value = int(answers.get(q["id"]))
+            except (TypeError, ValueError):
+                continue
+            X[r, c] = 6 - value if q.get("reverse", False) else value
+    return X
+
+
+def cronbach_alpha(X):
+    """Alpha over the complete rows of X (respondents x items); NaN if undefined."""
+    X = X[~np.isnan(X).any(axis=1)]
+    k = X.shape[1]
+    if k < 2 or X.shape[0] < 2:
+        return np.nan
+    total_var = X.sum(axis=1).var(ddof=1)
+    if total_var == 0:
+        return np.nan
+    return k / (k - 1) * (1 - X.var(axis=0, ddof=1).sum() / total_var)
+
+
+def item_statistics(X):
+    """Corrected item-total r and alpha-if-deleted for each column of X (complete rows)."""
+    X = X[~np.isnan(X).any(axis=1)]
+    n, k = X.shape
+    if n < 2 or k < 2:
+        return np.full(k, np.nan), np.full(k, np.nan)
+    rest = X.sum(axis=1)[:, None] - X
+    Xc, Rc = X - X.mean(axis=0), rest - rest.mean(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (Xc * Rc).sum(axis=0) / np.sqrt((Xc ** 2).sum(axis=0) * (Rc ** 2).sum(axis=0))
+        if k > 2:
+            item_var = X.var(axis=0, ddof=1)
+            alpha_drop = (k - 1) / (k - 2) * (1 - (item_var.sum() - item_var) / rest.var(axis=0, ddof=1))
+        else:
+            alpha_drop = np.full(k, np.nan)
+    return r, alpha_drop
+
+
+def _scales(questions):
+    scales = {}
+    for q in questions:
+        if q.get("type", "likert") != "forced":
+            scales.setdefault(q["style"], []).append(q)
+    return scales
+
+
+def analyze(answer_sets):
+    """Run the full item analysis. Returns a dict of DataFrames (empty if too few respondents)."""
+    answer_sets = [a for a in answer_sets if a]
+    out = {"respondents": len(answer_sets)}
+    if len(answer_sets) < MIN_RESPONDENTS:
+        return out
+
+    scale_rows, item_rows = [], []
+    for part, questions in (("Communication", COMM_QUESTIONS), ("Motivation", MOTIVATION_QUESTIONS)):
+        for scale, items in _scales(questions).items():
+            X = likert_matrix(answer_sets, items)
+            complete = int((~np.isnan(X).any(axis=1)).sum())
+            scale_rows.append({
+                "part": part, "scale": scale, "items": len(items), "complete_n": complete,
+                "alpha": cronbach_alpha(X),
+            })
+            r, alpha_drop = item_statistics(X)
+            for c, q in enumerate(items):
+                col = X[:, c]
+                item_rows.append({
+                    "id": q["id"], "scale": scale, "text": q["text"],
+                    "n": int((~np.isnan(col)).sum()),
+                    "mean": np.nanmean(col) if not np.isnan(col).all() else np.nan,
+                    "sd": np.nanstd(col, ddof=1) if (~np.isnan(col)).sum() > 1 else np.nan,
+                    "item_total_r": r[c], "alpha_if_dropped": alpha_drop[c],
+                })
+    out["scales"] = pd.DataFrame(scale_rows)
+    out["items"] = pd.DataFrame(item_rows)
+
+    forced_rows = []
+    for section in (ENGINE.comm, ENGINE.motiv):
+        X = section.encode(answer_sets)
+        for q, f in section.items:
+            if q.get("type", "likert") != "forced":
+                continue
+            chose_a, chose_b = X[:, f] == 1, X[:, f + 1] == 1
+            n = int((chose_a | chose_b).sum())
+            forced_rows.append({
+                "id": q["id"], "prompt": q["prompt"], "A": q["a_style"], "B": q["b_style"], "n": n,
+                "pct_A": 100.0 * chose_a.sum() / n if n else np.nan,
+            })
+    out["forced"] = pd.DataFrame(forced_rows)
+
+    comm, motiv, _ = ENGINE.score_matrix(answer_sets, answer_sets)
+    dist_rows = []
+    for part, section, scores in (("Communication", ENGINE.comm, comm), ("Motivation", ENGINE.motiv, motiv)):
+        scores = scores[~np.isnan(scores).any(axis=1)]
+        if not len(scores):
+            continue
+        primary = np.bincount(top_two_indices(scores)[:, 0], minlength=len(section.styles))
+        p10, p50, p90 = np.percentile(scores, [10, 50, 90], axis=0)
+        for i, style in enumerate(section.styles):
+            dist_rows.append({
+                "part": part, "style": style, "mean": scores[:, i].mean(), "sd": scores[:, i].std(ddof=1) if len(scores) > 1 else np.nan,
+                "p10": p10[i], "median": p50[i], "p90": p90[i], "primary_pct": 100.0 * primary[i] / len(scores),
+            })
+    out["scores"] = pd.DataFrame(dist_rows)
+    return out
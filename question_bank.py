@@ -0,0 +1,194 @@
+"""The assessment question bank, shared by the app, scoring and batch jobs.
+
+Kept free of Streamlit imports so headless tools (rescoring, checks) can load it.
+The lists are shared by every session and must not be modified.
+"""
+import hashlib
+import json
+import random
+from functools import lru_cache
+
+# --- ASSESSMENT QUESTIONS (OPTIMIZED HYBRID FORMAT) ---
+# Format types:
+#   - likert: 1–5 scale (behavior frequency / "most days")
+#   - forced: pick ONE of two statements (tradeoff / priority check)
+#
+# Notes:
+#   - This hybrid format improves discrimination and reduces "agree with everything" inflation.
+#   - Forced-choice items are used as tie-breakers and to reduce response bias.
+
+LIKERT_OPTIONS = [1, 2, 3, 4, 5]
+LIKERT_LABELS = {
+    1: "Strongly Disagree",
+    2: "Disagree",
+    3: "Neutral",
+    4: "Agree",
+    5: "Strongly Agree",
+}
+
+# Weights (keep simple + stable)
+LIKERT_WEIGHT = 1.0
+FORCED_WEIGHT = 3.0          # chosen option adds 3 points to its mapped style/driver
+STRESS_WEIGHT = 1.2          # small boost so stress-pattern items shape the primary/secondary more
+
+# --- Part 1: Communication Style (Day-to-day + Under Stress + Priority Check) ---
+COMM_QUESTIONS = [
+    # Director (Day-to-day)
+    {"id":"cL1","type":"likert","style":"Director","text":"When things feel unstructured, I naturally step in to define clear expectations and move us toward action."},
+    {"id":"cL2","type":"likert","style":"Director","text":"I feel most effective when I see staff utilizing their training and resources to solve problems rather than waiting for me to decide."},
+    {"id":"cL3","type":"likert","style":"Director","text":"In fast-moving situations, I prioritize momentum over discussion."},
+    {"id":"cL4","type":"likert","style":"Director","text":"Others often look to me when a decision needs to be made quickly."},
+    {"id":"cL5","type":"likert","style":"Director","text":"I would rather adjust a plan later than stall progress now."},
+
+    # Encourager (Day-to-day)
+    {"id":"cL6","type":"likert","style":"Encourager","text":"I pay close attention to how stress or morale is affecting the team."},
+    {"id":"cL7","type":"likert","style":"Encourager","text":"I intentionally name effort and wins to keep people motivated."},
+    {"id":"cL8","type":"likert","style":"Encourager","text":"After a crisis or hard shift, I prioritize reflecting with the team to process what happened."},
+    {"id":"cL9","type":"likert","style":"Encourager","text":"I feel confident encouraging staff to use their own problem-solving skills rather than giving them an immediate answer."},
+    {"id":"cL10","type":"likert","style":"Encourager","text":"I believe how we treat each other matters as much as what we get done."},
+
+    # Facilitator (Day-to-day)
+    {"id":"cL11","type":"likert","style":"Facilitator","text":"I help slow conversations down so everyone feels heard."},
+    {"id":"cL12","type":"likert","style":"Facilitator","text":"I often restate or summarize to help people understand each other."},
+    {"id":"cL13","type":"likert","style":"Facilitator","text":"I prefer shared buy-in over unilateral decisions."},
+    {"id":"cL14","type":"likert","style":"Facilitator","text":"I stay relatively calm when others are escalated."},
+    {"id":"cL15","type":"likert","style":"Facilitator","text":"I pay attention to how decisions are made, not just the result."},
+
+    # Tracker (Day-to-day)
+    {"id":"cL16","type":"likert","style":"Tracker","text":"When I notice gaps in documentation or routines, I view them as opportunities to teach or improve the system."},
+    {"id":"cL17","type":"likert","style":"Tracker","text":"I’m uncomfortable when expectations or procedures feel vague."},
+    {"id":"cL18","type":"likert","style":"Tracker","text":"I naturally track details others miss."},
+    {"id":"cL19","type":"likert","style":"Tracker","text":"I feel responsible for maintaining standards and consistency."},
+    {"id":"cL20","type":"likert","style":"Tracker","text":"I ask clarifying questions to prevent future problems."},
+
+    # Under stress (weighted)
+    {"id":"cS1","type":"likert","style":"Director","weight":STRESS_WEIGHT,"text":"Under pressure, I tend to take control immediately because I worry others won't complete the task effectively."},
+    {"id":"cS2","type":"likert","style":"Encourager","weight":STRESS_WEIGHT,"text":"When stressed, I become more emotionally attuned to others."},
+    {"id":"cS3","type":"likert","style":"Facilitator","weight":STRESS_WEIGHT,"text":"In conflict, I try to slow things down and reduce intensity."},
+    {"id":"cS4","type":"likert","style":"Tracker","weight":STRESS_WEIGHT,"text":"When anxious, I focus more on rules, procedures, or correctness."},
+
+    # Priority check (forced choice)
+    {"id":"cF1","type":"forced","prompt":"In a difficult shift, I’m more focused on…","a_text":"Making a clear decision and moving the team forward.","a_style":"Director","b_text":"Making sure people feel supported and steady.","b_style":"Encourager"},
+    {"id":"cF2","type":"forced","prompt":"When plans are unclear, I’m more likely to…","a_text":"Step in and define direction quickly.","a_style":"Director","b_text":"Ask questions and build alignment first.","b_style":"Facilitator"},
+    {"id":"cF3","type":"forced","prompt":"When something feels off, my first instinct is to…","a_text":"Check the details, expectations, and process gaps.","a_style":"Tracker","b_text":"Check the human dynamics and emotional temperature.","b_style":"Encourager"},
+    {"id":"cF4","type":"forced","prompt":"When disagreement starts escalating, I’m more likely to…","a_text":"Set the boundary and end the debate.","a_style":"Director","b_text":"Slow down, reflect back, and de-escalate.","b_style":"Facilitator"},
+]
+
+# --- Part 2: Motivation Drivers (Day-to-day + Priority Check + Burnout Context) ---
+MOTIVATION_QUESTIONS = [
+    # Growth
+    {"id":"mL1","type":"likert","style":"Growth","text":"I view difficult behaviors or shifts as opportunities to build new skills."},
+    {"id":"mL2","type":"likert","style":"Growth","text":"I’m motivated by opportunities to improve my skills."},
+    {"id":"mL3","type":"likert","style":"Growth","text":"Doing the same work repeatedly drains my energy."},
+    {"id":"mL4","type":"likert","style":"Growth","text":"Feedback that helps me grow matters to me."},
+    {"id":"mL5","type":"likert","style":"Growth","text":"I feel motivated when there is an environment of support for my development."},
+
+    # Purpose
+    {"id":"mL6","type":"likert","style":"Purpose","text":"I need to feel my work aligns with values about youth and dignity."},
+    {"id":"mL7","type":"likert","style":"Purpose","text":"Decisions that don’t make sense for youth bother me deeply."},
+    {"id":"mL8","type":"likert","style":"Purpose","text":"Meaning matters more to me than efficiency alone."},
+    {"id":"mL9","type":"likert","style":"Purpose","text":"I feel proud when I can see real impact."},
+    {"id":"mL10","type":"likert","style":"Purpose","text":"I set goals for myself to achieve even if those goals were not clearly set by others."},
+
+    # Connection
+    {"id":"mL11","type":"likert","style":"Connection","text":"Feeling connected to coworkers affects my motivation."},
+    {"id":"mL12","type":"likert","style":"Connection","text":"Team tension drains my energy quickly."},
+    {"id":"mL13","type":"likert","style":"Connection","text":"I value being known and supported by my supervisor."},
+    {"id":"mL14","type":"likert","style":"Connection","text":"I’m more likely to go above and beyond when I feel valued and supported."},
+    {"id":"mL15","type":"likert","style":"Connection","text":"When the team feels disconnected, I feel motivated to communicate and resolve the tension."},
+
+    # Achievement
+    {"id":"mL16","type":"likert","style":"Achievement","text":"Clear goals help me feel effective."},
+    {"id":"mL17","type":"likert","style":"Achievement","text":"I like knowing exactly what success looks like."},
+    {"id":"mL18","type":"likert","style":"Achievement","text":"I’m motivated by measurable progress."},
+    {"id":"mL19","type":"likert","style":"Achievement","text":"I feel satisfied when I can see that my effort led to positive improvements."},
+    {"id":"mL20","type":"likert","style":"Achievement","text":"Ambiguous expectations frustrate me."},
+
+    # Priority check (forced choice)
+    {"id":"mF1","type":"forced","prompt":"What drains me faster?","a_text":"Lack of progress / unclear outcomes.","a_style":"Achievement","b_text":"Lack of connection / tension on the team.","b_style":"Connection"},
+    {"id":"mF2","type":"forced","prompt":"What restores me faster?","a_text":"Seeing improvement, mastery, or learning.","a_style":"Growth","b_text":"Seeing real positive impact on youth/people.","b_style":"Purpose"},
+    {"id":"mF3","type":"forced","prompt":"If I’m frustrated at work, it’s usually because…","a_text":"The system isn’t matching the mission for youth.","a_style":"Purpose","b_text":"Expectations and targets aren’t clear or stable.","b_style":"Achievement"},
+    {"id":"mF4","type":"forced","prompt":"If I’m offered a new opportunity, I’m more likely to say yes when…","a_text":"It builds my skills and stretches me.","a_style":"Growth","b_text":"It deepens relationships and team connection.","b_style":"Connection"},
+
+    # Burnout context (stored separately; not used to select primary/secondary)
+    {"id":"mB1","type":"likert","style":"Context","text":"When I feel emotionally exhausted, even work I care about becomes hard to engage with."},
+    {"id":"mB2","type":"likert","style":"Context","text":"When I’m burned out, I become more detached or numb during the shift."},
+    {"id":"mB3","type":"likert","style":"Context","text":"When I’m burned out, small problems feel bigger than they should."},
+    {"id":"mB4","type":"likert","style":"Context","text":"After an emotionally or physically draining week, I find it difficult to prioritize my own self-care."},
+]
+
+# Score keys in display/tie-break order (matches COMM_PROFILES / MOTIVATION_PROFILES).
+COMM_STYLES = ["Director", "Encourager", "Facilitator", "Tracker"]
+MOTIV_DRIVERS = ["Growth", "Purpose", "Connection", "Achievement"]
+CONTEXT_STYLE = "Context"   # burnout items: averaged separately, never scored as a driver
+
+
+@lru_cache(maxsize=1024)
+def question_order(seed):
+    """The (communication, motivation) question order for a session's ``seed``.
+
+    Sessions store only the integer seed; the tuples returned here reference
+    the shared bank. ``random.Random(seed).shuffle`` is deterministic across
+    Python 3 releases, so a seed saved with a submission reproduces the order
+    the person saw (as long as the bank itself has not changed).
+    """
+    rng = random.Random(seed)
+    comm, motiv = list(COMM_QUESTIONS), list(MOTIVATION_QUESTIONS)
+    rng.shuffle(comm)
+    rng.shuffle(motiv)
+    return tuple(comm), tuple(motiv)
+
+
+def new_order_seed():
+    return random.SystemRandom().randrange(2 ** 31)
+
+
+# --- Answer wire format ---
+# Saved answers are compact: {question_id: 1-5} for Likert items and {question_id: "A"/"B"}
+# for forced choice, sent with the QUESTION_BANK_VERSION they were given under.
+QUESTIONS_BY_ID = {q["id"]: q for q in COMM_QUESTIONS + MOTIVATION_QUESTIONS}
+
+# Changes whenever any item's wording, keying, style or weight changes.
+QUESTION_BANK_VERSION = hashlib.sha1(
+    json.dumps([COMM_QUESTIONS, MOTIVATION_QUESTIONS, LIKERT_WEIGHT, FORCED_WEIGHT], sort_keys=True).encode("utf-8")
+).hexdigest()[:10]
+
+
+def encode_answers(*answer_dicts):
+    """Merge ``{question_id: answer}`` dicts into the compact wire format, dropping unknown ids."""
+    flat = {}
+    for answers in answer_dicts:
+        for qid, raw in (answers or {}).items():
+            q = QUESTIONS_BY_ID.get(qid)
+            if q is None or raw is None:
+                continue
+            if q.get("type") == "forced":
+                if raw in ("A", "B"):
+                    flat[qid] = raw
+                elif raw == q.get("a_text"):
+                    flat[qid] = "A"
+                elif raw == q.get("b_text"):
+                    flat[qid] = "B"
+            else:
+                try:
+                    flat[qid] = int(raw)
+                except (TypeError, ValueError):
+                    pass
+    return flat
+
+
+def decode_answers(flat):
+    """Expand compact answers to readable values for the sheet or exports.
+
+    Forced-choice ``A``/``B`` become the chosen statement text (older rows that
+    already hold text pass through). Text comes from the current bank, so rows
+    saved under another QUESTION_BANK_VERSION may not match what was shown.
+    """
+    readable = {}
+    for qid, raw in (flat or {}).items():
+        q = QUESTIONS_BY_ID.get(qid)
+        if q is not None and q.get("type") == "forced" and raw in ("A", "B"):
+            readable[qid] = q["a_text"] if raw == "A" else q["b_text"]
+        else:
+            readable[qid] = raw
+    return readable
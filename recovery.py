@@ -0,0 +1,145 @@
+"""Local email -> latest result index for the "Recover your results" flow.
+
+Recovery used to be a synchronous Apps Script lookup that scanned the whole
+sheet for the email. ``ResultIndex`` keeps the newest result per email in a
+small SQLite table instead. The full-org roster sync feeds it every changed
+row, and new submissions are recorded the moment they are queued, so lookups
+take milliseconds. The remote lookup is only used for emails the index has
+never seen.
+
+People who took the assessment more than once resolve to their most recent
+submission: an entry is only replaced by a row with a newer timestamp (or, for
+equal timestamps, a higher row id) or by the same row again, e.g. after rescoring.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import streamlit as st
+
+from config import SHEET_TIMEZONE, data_path
+from roster import ROW_ID, RosterScope
+from storage import get_roster_cache, get_storage
+
+SCORE_COLUMNS = {"p_comm": "primaryComm", "s_comm": "secondaryComm", "p_mot": "primaryMotiv", "s_mot": "secondaryMotiv"}
+
+
+def _epoch(value):
+    """Best-effort conversion of a sheet timestamp to epoch seconds (0 when unknown).
+
+    Naive timestamps are in the sheet's zone (SHEET_TIMEZONE, else server local time),
+    so they order correctly against the ``time.time()`` stamps of record().
+    """
+    if value is None or (isinstance(value, float) and pd.isna(value)) or value == "":
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    ts = pd.to_datetime(value, errors="coerce")
+    if pd.isna(ts):
+        return 0.0
+    if ts.tzinfo is None:
+        if SHEET_TIMEZONE is None:
+            return ts.to_pydatetime().timestamp()   # naive datetime -> local time
+        ts = ts.tz_localize(SHEET_TIMEZONE, ambiguous=True, nonexistent="shift_forward")
+    return ts.timestamp()
+
+
+def _row_scores(row):
+    scores = row.get("scores")
+    if isinstance(scores, str) and scores.strip():
+        try:
+            scores = json.loads(scores)
+        except ValueError:
+            scores = None
+    if isinstance(scores, dict) and scores:
+        return scores
+    return {key: row.get(col) for col, key in SCORE_COLUMNS.items() if row.get(col)}
+
+
+class ResultIndex:
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS latest_results (
+                    email TEXT PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    row_id INTEGER NOT NULL DEFAULT 0,
+                    user_info TEXT NOT NULL,
+                    scores TEXT NOT NULL
+                )"""
+            )
+
+    def _upsert(self, entries):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT INTO latest_results (email, timestamp, row_id, user_info, scores) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(email) DO UPDATE SET
+                       timestamp = excluded.timestamp, row_id = excluded.row_id,
+                       user_info = excluded.user_info, scores = excluded.scores
+                   WHERE (excluded.timestamp, excluded.row_id) >= (latest_results.timestamp, latest_results.row_id)""",
+                entries,
+            )
+
+    def update_from_rows(self, rows_df):
+        """Index the newest row per email from a roster DataFrame (a sync delta)."""
+        if rows_df.empty or "email" not in rows_df.columns:
+            return
+        entries = []
+        for row in rows_df.to_dict("records"):
+            email = str(row.get("email") or "").strip().lower()
+            scores = _row_scores(row)
+            if "@" not in email or not scores.get("primaryComm") or not scores.get("primaryMotiv"):
+                continue
+            user_info = {k: row.get(k) for k in ("name", "email", "role", "cottage")}
+            row_id = row.get(ROW_ID)
+            row_id = int(row_id) if row_id is not None and not pd.isna(row_id) else 0
+            entries.append((email, _epoch(row.get("timestamp")), row_id, json.dumps(user_info, default=str), json.dumps(scores, default=str)))
+        self._upsert(entries)
+
+    def record(self, payload, timestamp=None):
+        """Index a submission made in this process (before the roster sync sees it)."""
+        email = str(payload.get("email") or "").strip().lower()
+        if not email:
+            return
+        user_info = {k: payload.get(k) for k in ("name", "email", "role", "cottage")}
+        self._upsert([(email, timestamp or time.time(), 0, json.dumps(user_info), json.dumps(payload.get("scores") or {}))])
+
+    def lookup(self, email):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT user_info, scores FROM latest_results WHERE email = ?", (str(email).strip().lower(),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"found": True, "user_info": json.loads(row[0]), "scores": json.loads(row[1])}
+
+
+@st.cache_resource
+def get_result_index():
+    """The process-wide index, subscribed to the full-org roster sync."""
+    index = ResultIndex(data_path("results_index.sqlite3"))
+    get_roster_cache(RosterScope()).subscribe(index.update_from_rows)
+    return index
+
+
+def recover_results(email):
+    """Latest result for ``email``: local index first, remote lookup as a fallback."""
+    index = get_result_index()
+    roster = get_roster_cache(RosterScope())
+    if roster.idle:
+        roster.refresh()   # nobody has read the roster for a while, so the index may be behind
+    roster.touch()
+    found = index.lookup(email)
+    if found:
+        return found
+    try:
+        data = get_storage().retrieve_by_email(email)
+    except Exception:
+        return None
+    if data and data.get("found") and isinstance(data.get("scores"), dict):
+        index.record(dict(data.get("user_info") or {}, email=email, scores=data["scores"]), timestamp=0.0)
+    return data
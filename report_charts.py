@@ -0,0 +1,211 @@
+"""Static chart images for the PDF reports.
+
+The on-screen guide draws its charts with Plotly, which FPDF cannot embed. The
+four style charts depend only on style keys, so each variant is drawn once with
+matplotlib, saved as a PNG under DATA_DIR (shared by every server process) and
+reused by every report: 4 quadrants, 4 gauges, 16 compasses and 20 dial sets
+in all. ``chart_png`` returns the file path, which is what ``FPDF.image``
+takes. The data tables here are shared with the Plotly versions in the
+supervisor portal, so the two stay in step.
+"""
+import io
+import os
+import threading
+from functools import lru_cache
+
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle, Wedge
+from PIL import Image
+
+from config import data_path
+
+# Bump when the drawings change so stale PNGs on disk are not reused.
+CHART_VERSION = 1
+CHART_DPI = 150
+
+BRAND_COLORS = {
+    "blue": "#1a73e8",
+    "green": "#34a853",
+    "teal": "#12b5cb",
+    "gray": "#5f6368",
+    "red": "#ea4335",
+    "yellow": "#fbbc04"
+}
+
+COMM_QUADRANT_POINTS = {
+    "Director": {"x": -0.5, "y": 0.5, "color": BRAND_COLORS['red']},
+    "Encourager": {"x": 0.5, "y": 0.5, "color": BRAND_COLORS['yellow']},
+    "Tracker": {"x": -0.5, "y": -0.5, "color": BRAND_COLORS['blue']},
+    "Facilitator": {"x": 0.5, "y": -0.5, "color": BRAND_COLORS['green']}
+}
+
+# Baseline dial settings by style (0-10)
+COMM_DIAL_BASE = {
+    "Director":     {"Clarity": 9, "Warmth": 4, "Structure": 6, "Pace": 9},
+    "Encourager":   {"Clarity": 6, "Warmth": 9, "Structure": 4, "Pace": 7},
+    "Facilitator": {"Clarity": 6, "Warmth": 7, "Structure": 5, "Pace": 5},
+    "Tracker":     {"Clarity": 7, "Warmth": 4, "Structure": 9, "Pace": 4},
+}
+
+MOTIV_COLORS = {
+    "Achievement": BRAND_COLORS['blue'],
+    "Growth": BRAND_COLORS['green'],
+    "Purpose": BRAND_COLORS['red'],
+    "Connection": BRAND_COLORS['yellow']
+}
+
+# Compass coordinates: X = People(pos)/Task(neg), Y = Change(pos)/Stability(neg)
+COMPASS_COMM_POINTS = {
+    "Director": {"x": -6, "y": 6}, "Encourager": {"x": 6, "y": 6},
+    "Facilitator": {"x": 6, "y": -6}, "Tracker": {"x": -6, "y": -6}
+}
+COMPASS_MOTIV_POINTS = {
+    "Achievement": {"x": -3, "y": 4}, "Growth": {"x": 2, "y": 7},
+    "Purpose": {"x": 5, "y": 3}, "Connection": {"x": 7, "y": -2}
+}
+
+
+def comm_dial_values(primary_style, secondary_style=None):
+    """Dial settings for a style, with the secondary blended in at 35% weight for nuance."""
+    p = COMM_DIAL_BASE.get(primary_style, COMM_DIAL_BASE["Facilitator"]).copy()
+    if secondary_style and secondary_style in COMM_DIAL_BASE:
+        s = COMM_DIAL_BASE[secondary_style]
+        for k in p:
+            p[k] = round((p[k] * 0.65) + (s.get(k, p[k]) * 0.35), 1)
+    return p
+
+
+def compass_point(comm, motiv):
+    """The 'Integrated Center': the average of the style and driver points."""
+    c_pt = COMPASS_COMM_POINTS.get(comm, {"x": 0, "y": 0})
+    m_pt = COMPASS_MOTIV_POINTS.get(motiv, {"x": 0, "y": 0})
+    return (c_pt["x"] + m_pt["x"]) / 2, (c_pt["y"] + m_pt["y"]) / 2
+
+
+# --- Renderers (matplotlib versions of the portal's Plotly charts) ---
+def _axes(fig, lim):
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_xlim(-lim, lim)
+    ax.set_ylim(-lim, lim)
+    ax.set_aspect("equal")
+    ax.axis("off")
+    return ax
+
+
+def _center_lines(ax, extent):
+    ax.plot([-extent, extent], [0, 0], color="gray", linewidth=1)
+    ax.plot([0, 0], [-extent, extent], color="gray", linewidth=1)
+
+
+def _draw_quadrant(comm_style):
+    fig = Figure(figsize=(3, 3))
+    ax = _axes(fig, 1.25)
+    for x0, y0, color in ((-1, 0, BRAND_COLORS['red']), (0, 0, BRAND_COLORS['yellow']),
+                          (-1, -1, BRAND_COLORS['blue']), (0, -1, BRAND_COLORS['green'])):
+        ax.add_patch(Rectangle((x0, y0), 1, 1, color=color, alpha=0.1, linewidth=0))
+    _center_lines(ax, 1)
+    point = COMM_QUADRANT_POINTS.get(comm_style, {"x": 0, "y": 0, "color": "gray"})
+    ax.scatter([point["x"]], [point["y"]], s=500, color=point["color"], edgecolors="white", linewidths=2, zorder=3)
+    ax.text(point["x"], point["y"] - 0.2, comm_style, ha="center", va="top", fontsize=12, fontweight="bold")
+    label = {"fontsize": 8, "color": "gray"}
+    ax.text(0, 1.12, "FAST / ACTION", ha="center", va="center", **label)
+    ax.text(0, -1.12, "SLOW / PROCESS", ha="center", va="center", **label)
+    ax.text(-1.12, 0, "TASK", ha="center", va="center", rotation=90, **label)
+    ax.text(1.12, 0, "PEOPLE", ha="center", va="center", rotation=-90, **label)
+    return fig
+
+
+def _draw_dials(primary_style, secondary_style):
+    values = comm_dial_values(primary_style, secondary_style)
+    labels = list(values)
+    fig = Figure(figsize=(4.5, 2.6))
+    ax = fig.add_axes([0.2, 0.2, 0.75, 0.65])
+    bars = ax.barh(labels, [values[k] for k in labels], color=BRAND_COLORS['blue'])
+    ax.bar_label(bars, labels=[str(values[k]) for k in labels], label_type="center", color="white", fontsize=9)
+    ax.invert_yaxis()
+    ax.set_xlim(0, 10)
+    ax.set_xlabel("Dial strength (0-10)", fontsize=8)
+    ax.set_title("Communication Dials (what to turn up/down)", fontsize=10)
+    ax.tick_params(labelsize=8)
+    for side in ("top", "right"):
+        ax.spines[side].set_visible(False)
+    return fig
+
+
+def _draw_gauge(motiv_style, value=90):
+    fig = Figure(figsize=(3, 2))
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_xlim(-1.2, 1.2)
+    ax.set_ylim(-0.35, 1.25)
+    ax.set_aspect("equal")
+    ax.axis("off")
+    ax.add_patch(Wedge((0, 0), 1, 0, 180, width=0.3, facecolor="#e8f0fe", edgecolor="gray", linewidth=1.5))
+    end = 180 * value / 100
+    ax.add_patch(Wedge((0, 0), 0.95, 180 - end, 180, width=0.2, color=MOTIV_COLORS.get(motiv_style, "gray")))
+    ax.text(0, 0.05, str(value), ha="center", va="bottom", fontsize=20)
+    ax.text(0, 1.12, f"{motiv_style} Drive", ha="center", va="center", fontsize=11)
+    return fig
+
+
+def _draw_compass(comm, motiv):
+    fig = Figure(figsize=(3, 3))
+    ax = _axes(fig, 12.5)
+    for x0, y0, color in ((-10, 0, "#fce8e6"), (0, 0, "#fef7e0"), (-10, -10, "#e8f0fe"), (0, -10, "#e6f4ea")):
+        ax.add_patch(Rectangle((x0, y0), 10, 10, color=color, linewidth=0))
+    _center_lines(ax, 10)
+    x, y = compass_point(comm, motiv)
+    ax.scatter([x], [y], s=550, color=BRAND_COLORS['blue'], edgecolors="white", linewidths=3, zorder=3)
+    ax.text(x, y, "YOU", ha="center", va="center", color="white", fontsize=8, fontweight="bold", zorder=4)
+    label = {"fontsize": 8, "color": "gray", "fontweight": "bold"}
+    ax.text(0, 11.2, "CHANGE / SPEED", ha="center", va="center", **label)
+    ax.text(0, -11.2, "STABILITY / PROCESS", ha="center", va="center", **label)
+    ax.text(-11.2, 0, "TASK", ha="center", va="center", rotation=90, **label)
+    ax.text(11.2, 0, "PEOPLE", ha="center", va="center", rotation=-90, **label)
+    return fig
+
+
+CHART_RENDERERS = {
+    "quadrant": _draw_quadrant,
+    "dials": _draw_dials,
+    "gauge": _draw_gauge,
+    "compass": _draw_compass,
+}
+
+_render_lock = threading.Lock()
+
+
+def chart_png(kind, *styles):
+    """Path to the PNG for chart ``kind`` and its style keys, drawing it on first use."""
+    # Blank style cells come through as NaN, which never equals itself as a cache key.
+    return _chart_png(kind, tuple(s if isinstance(s, str) and s else None for s in styles))
+
+
+@lru_cache(maxsize=None)
+def _chart_png(kind, styles):
+    name = "-".join([kind, *(str(s).replace(" ", "_") for s in styles)]) + ".png"
+    path = data_path("charts", f"v{CHART_VERSION}", name)
+    with _render_lock:
+        if not os.path.exists(path):
+            buf = io.BytesIO()
+            CHART_RENDERERS[kind](*styles).savefig(buf, format="png", dpi=CHART_DPI, facecolor="white")
+            # Flatten to RGB: FPDF splits an alpha channel out pixel by pixel on every embed.
+            tmp = f"{path}.{os.getpid()}.tmp"
+            Image.open(buf).convert("RGB").save(tmp, format="PNG")
+            os.replace(tmp, path)
+    return path
+
+
+def draw_chart_row(pdf, paths, height=45, gap=4):
+    """Place chart PNGs side by side at the current position, each ``height`` mm tall."""
+    if pdf.get_y() + height > pdf.page_break_trigger:
+        pdf.add_page()
+    y = pdf.get_y()
+    widths = []
+    for path in paths:
+        with Image.open(path) as im:
+            widths.append(height * im.width / im.height)
+    x = pdf.l_margin + (pdf.w - pdf.l_margin - pdf.r_margin - sum(widths) - gap * (len(paths) - 1)) / 2
+    for path, w in zip(paths, widths):
+        pdf.image(path, x, y, w, height)
+        x += w + gap
+    pdf.set_y(y + height + gap)
@@ -0,0 +1,114 @@
+"""Pre-rendered participant report bodies, one per profile combination.
+
+Apart from the name/role header, the participant PDF and HTML email depend
+only on (primaryComm, primaryMotiv, role_key): 4 x 4 x 3 = 48 PDF bodies and
+16 HTML bodies. ``FragmentStore`` renders each of those once per content
+version and keeps it in memory and on disk (shared by every server process
+using the same data directory); a report is then just the cached body plus a
+personalized header.
+
+PDF bodies are FPDF documents whose first page starts with an empty header
+slot. ``personalize_pdf`` draws the header for one person into a copy of the
+template and splices it into that slot. This works because the header is a
+fixed-height block: the body's layout never depends on the name or role.
+"""
+import copy
+import logging
+import os
+import pickle
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class FragmentStore:
+    """Memory + disk cache of rendered fragments, keyed by ``(kind, combo)``.
+
+    Files live under ``directory/<version>/``; a new content version simply
+    starts a new folder, so stale fragments are never served.
+    """
+
+    def __init__(self, directory, version):
+        self.directory = os.path.join(directory, version)
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory = {}
+
+    def _path(self, kind, combo):
+        return os.path.join(self.directory, f"{kind}-{'-'.join(combo)}.pkl")
+
+    def get(self, kind, combo, build):
+        """The fragment for ``combo``, rendering it with ``build()`` on first use."""
+        key = (kind, tuple(combo))
+        value = self._memory.get(key)
+        if value is not None:
+            return value
+        path = self._path(kind, combo)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            value = None
+        except Exception as e:
+            log.warning("Ignoring unreadable report fragment %s: %s", path, e)
+            value = None
+        if value is None:
+            value = build()
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            except OSError as e:
+                log.warning("Could not persist report fragment %s: %s", path, e)
+        with self._lock:
+            self._memory[key] = value
+        return value
+
+    def warm(self, jobs):
+        """Render ``[(kind, combo, build), ...]`` in a daemon thread (startup warm-up)."""
+        def run():
+            for kind, combo, build in jobs:
+                try:
+                    self.get(kind, combo, build)
+                except Exception as e:
+                    log.warning("Warm-up of %s %s failed: %s", kind, combo, e)
+        thread = threading.Thread(target=run, name="report-fragments-warmup", daemon=True)
+        thread.start()
+        return thread
+
+
+class PdfTemplate:
+    """An FPDF document whose first page has an empty slot for the header."""
+
+    def __init__(self, pdf, prefix, body):
+        self.pdf = pdf          # finished body, not yet output
+        self.prefix = prefix    # page 1 operators emitted by add_page(), before the header
+        self.body = body        # page 1 operators after the header
+
+
+def build_pdf_template(make_pdf, draw_header, draw_body, placeholder):
+    """Render ``draw_body`` under a placeholder header and cut the header out of page 1."""
+    pdf = make_pdf()
+    pdf.add_page()
+    start = len(pdf.pages[1])
+    draw_header(pdf, placeholder)
+    end = len(pdf.pages[1])
+    draw_body(pdf)
+    page_one = pdf.pages[1]
+    return PdfTemplate(pdf, page_one[:start], page_one[end:])
+
+
+def personalize_pdf(template, draw_header, user_info):
+    """PDF bytes for ``user_info``: the template body with their header spliced in."""
+    pdf = copy.deepcopy(template.pdf)
+    last_page, x, y = pdf.page, pdf.x, pdf.y
+    pdf.page = 1
+    pdf.pages[1] = template.prefix
+    # Draw from the page's initial state so the header emits its own font operators.
+    pdf.font_family = ""
+    pdf.x, pdf.y = pdf.l_margin, pdf.t_margin
+    draw_header(pdf, user_info)
+    pdf.pages[1] += template.body
+    pdf.page, pdf.x, pdf.y = last_page, x, y
+    return pdf.output(dest="S").encode("latin-1")
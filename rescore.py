@@ -0,0 +1,125 @@
+"""Headless batch job: rescore stored submissions with the current question bank.
+
+Stored ``scores`` are frozen at submission time, so tuning ``LIKERT_WEIGHT``,
+``FORCED_WEIGHT`` or item keys in question_bank.py never reached old records.
+This job streams every stored answer set from the configured backend, rescores
+it in vectorized chunks with scoring.ScoringEngine, and writes back only the
+records whose profile actually changed.
+
+    COMPASS_STORAGE=sqlite python rescore.py --dry-run
+    python rescore.py --chunk-size 10000
+
+Records with incomplete answers (e.g. offline entries typed in by a supervisor)
+are left untouched and counted as skipped. Backends that can't list answers or
+write scores back (``supports_rescoring``; the Apps Script until it ships the
+listAnswers/updateScores actions) are refused before anything is read.
+"""
+import argparse
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from scoring import ENGINE
+
+log = logging.getLogger(__name__)
+
+SCORE_TOLERANCE = 1e-9
+
+
+@dataclass
+class RescoreReport:
+    scanned: int = 0
+    skipped: int = 0
+    changed: int = 0
+    primary_comm_flips: int = 0
+    primary_motiv_flips: int = 0
+    seconds: float = 0.0
+
+    def summary(self):
+        return (
+            f"Rescored {self.scanned - self.skipped} of {self.scanned} submissions in {self.seconds:.2f}s: "
+            f"{self.changed} changed, {self.primary_comm_flips} primary style flip(s), "
+            f"{self.primary_motiv_flips} primary driver flip(s), {self.skipped} skipped."
+        )
+
+
+def _scores_differ(old, new):
+    for key in ("primaryComm", "secondaryComm", "primaryMotiv", "secondaryMotiv"):
+        if old.get(key) != new[key]:
+            return True
+    for key in ("commScores", "motivScores"):
+        before = old.get(key) or {}
+        for style, value in new[key].items():
+            try:
+                if abs(float(before.get(style)) - value) > SCORE_TOLERANCE:
+                    return True
+            except (TypeError, ValueError):
+                return True
+    return old.get("burnoutScore") != new["burnoutScore"]
+
+
+def rescore_chunk(records, engine=ENGINE):
+    """Rescore one chunk. Returns ``(updates, report)`` without writing anything."""
+    report = RescoreReport(scanned=len(records))
+    answers = [r["answers"] or {} for r in records]
+    comm, motiv, burnout = engine.score_matrix(answers, answers)
+    complete = ~(np.isnan(comm).any(axis=1) | np.isnan(motiv).any(axis=1))
+    report.skipped = int((~complete).sum())
+    idx = np.flatnonzero(complete)
+    updates = []
+    for record, new in zip((records[i] for i in idx), engine.results(comm[idx], motiv[idx], burnout[idx])):
+        old = record.get("scores") or {}
+        if not _scores_differ(old, new):
+            continue
+        report.changed += 1
+        report.primary_comm_flips += old.get("primaryComm") != new["primaryComm"]
+        report.primary_motiv_flips += old.get("primaryMotiv") != new["primaryMotiv"]
+        updates.append((record["key"], new))
+    return updates, report
+
+
+def rescore(storage, engine=ENGINE, chunk_size=5000, dry_run=False):
+    """Rescore every stored submission in ``storage``. Returns a RescoreReport.
+
+    Raises storage.RescoringUnsupported when the backend can't do it.
+    """
+    if not storage.supports_rescoring:
+        from storage import RescoringUnsupported
+        raise RescoringUnsupported(f"{type(storage).__name__} can't list answers or update scores")
+    started = time.perf_counter()
+    total = RescoreReport()
+    for records in storage.iter_answers(batch_size=chunk_size):
+        updates, report = rescore_chunk(records, engine)
+        if updates and not dry_run:
+            storage.update_scores(updates)
+        for field in ("scanned", "skipped", "changed", "primary_comm_flips", "primary_motiv_flips"):
+            setattr(total, field, getattr(total, field) + getattr(report, field))
+        log.info("Rescored %d submissions so far (%d changed)", total.scanned, total.changed)
+    total.seconds = time.perf_counter() - started
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing them back")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    from storage import StorageError, make_storage
+    try:
+        report = rescore(make_storage(), chunk_size=args.chunk_size, dry_run=args.dry_run)
+    except StorageError as e:
+        parser.exit(1, f"rescore: {e}\n")
+    if args.json:
+        import json
+        print(json.dumps(asdict(report)))
+    else:
+        print(("[dry run] " if args.dry_run else "") + report.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""Process-wide staff roster cache for the supervisor portal.
+
+The portal used to re-download the whole roster from Apps Script every time the
+60 second ``st.cache_data`` entry expired, so whichever supervisor happened to
+load the page at that moment paid for the round trip. ``RosterCache`` keeps the
+last good snapshot in memory and refreshes it from a daemon thread instead:
+readers never wait on Google after the first load, and a failed refresh keeps
+the previous snapshot rather than blanking the roster.
+
+Refreshes are incremental. The cache remembers the cursor returned by the
+backend and asks only for rows changed since then; those rows are normalized on
+their own and upserted into the cached frame by ``row_id``. A backend that
+still returns a bare list of rows is treated as a full snapshot, so the legacy
+Apps Script keeps working unchanged.
+
+Delta protocol (response to a fetch with ``since=<cursor>``)::
+
+    {"rows": [...changed rows...], "deleted": [row_id, ...],
+     "cursor": "<opaque>", "full": false}
+
+``full: true`` (or a missing ``since``) means ``rows`` is the whole roster.
+
+Fetches are scoped when the backend can filter (``scoped_reads`` on the
+storage backend). Each cache is then bound to a ``RosterScope`` (the cottage
+and roles a viewer may see) and sends it as a ``scope`` JSON query parameter,
+so the backend only returns permitted rows. The cache applies the same rule to
+whatever comes back, so rows outside the scope are dropped (and evicted if they
+moved out of it). Caches are keyed by ``RosterScope.shared()``, which leaves out
+the per-user ``names`` rule; the names rule is applied per session. A backend
+that cannot filter (the deployed Apps Script) would send the whole sheet for
+every scope, so there is a single full-org cache instead and scoped readers
+use ``RosterCache.view``, a masked copy shared by all readers of that scope.
+
+A cache polls only while it is being read: after ``ROSTER_IDLE_SECONDS``
+without a ``get()`` its thread exits, and the next read restarts it.
+``storage.SqliteStorage`` implements the same protocol for offline use.
+
+When given a ``snapshot_path`` the cache also persists every new snapshot to a
+local Parquet file (plus a small JSON sidecar with the cursor and fetch time).
+A restarted process loads that file instantly and reconciles with the backend
+in the background, and the portal keeps a read-only roster while Google is
+unreachable.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+ROSTER_REFRESH_SECONDS = 60
+ROSTER_IDLE_SECONDS = 15 * 60
+ROW_ID = "row_id"
+
+
+@dataclass(frozen=True)
+class RosterScope:
+    """Which roster rows a viewer may receive.
+
+    A row is in scope when its cottage matches (or ``cottage`` is None) and its
+    role is allowed: listed in ``roles``, containing one of ``role_keywords``,
+    or the row's name is in ``names``. With both role filters None, every role
+    is allowed.
+    """
+    cottage: str = None
+    roles: tuple = None
+    role_keywords: tuple = None
+    names: tuple = ()
+
+    @property
+    def is_full(self):
+        return self.cottage is None and self.roles is None and self.role_keywords is None
+
+    def shared(self):
+        """The scope to fetch and cache under.
+
+        ``names`` makes a scope per-user, so such scopes widen to the whole cottage
+        (which includes the user's own row); callers narrow the result with scope_mask.
+        """
+        if not self.names:
+            return self
+        return RosterScope(cottage=self.cottage)
+
+    def to_json(self):
+        return json.dumps(asdict(self), sort_keys=True)
+
+    def key(self):
+        """Stable short id, used to name per-scope snapshot files."""
+        if self.is_full:
+            return "all"
+        return hashlib.sha1(self.to_json().encode("utf-8")).hexdigest()[:12]
+
+
+def scope_for_user(user_role, user_cottage, user_name):
+    """The RBAC rules of the supervisor portal, expressed as a RosterScope."""
+    user_role, user_cottage, user_name = str(user_role), str(user_cottage), str(user_name)
+    if user_role == "Admin" or user_name == "Administrator" or "Director" in user_role or "Manager" in user_role:
+        return RosterScope()
+    cottage = None if user_cottage == "All" else user_cottage
+    if "Program Supervisor" in user_role:
+        return RosterScope(cottage=cottage)
+    if "Shift Supervisor" in user_role:
+        return RosterScope(cottage=cottage, roles=("YDP",), names=(user_name,))
+    if "YDP" in user_role:
+        return RosterScope(cottage=cottage, roles=(), names=(user_name,))
+    return RosterScope(cottage=cottage)
+
+
+def scope_mask(df, scope):
+    """Boolean Series selecting the rows of a normalized roster that ``scope`` permits."""
+    mask = pd.Series(True, index=df.index)
+    if scope.is_full or df.empty:
+        return mask
+    if scope.cottage is not None and 'cottage' in df.columns:
+        mask &= df['cottage'] == scope.cottage
+    if (scope.roles is not None or scope.role_keywords is not None) and 'role' in df.columns:
+        allowed = pd.Series(False, index=df.index)
+        if scope.roles is not None:
+            allowed |= df['role'].isin(scope.roles)
+        if scope.role_keywords:
+            allowed |= df['role'].str.contains('|'.join(scope.role_keywords), case=False, na=False)
+        if scope.names and 'name' in df.columns:
+            allowed |= df['name'].isin(scope.names)
+        mask &= allowed
+    return mask
+
+
+def roster_fingerprint(df):
+    """Short id for a roster's contents that changes when rows are added, not on every refresh.
+
+    For backends without a sync cursor (the bare-list Apps Script), whose snapshots are
+    rebuilt on every poll.
+    """
+    parts = [len(df)]
+    for col in (ROW_ID, "timestamp"):
+        if col in df.columns and not df.empty:
+            parts.append(df[col].astype(str).max())
+    return hashlib.sha1(json.dumps(parts).encode("utf-8")).hexdigest()[:12]
+
+
+def filter_rows(rows, scope):
+    """Apply ``scope`` to raw sheet rows (the backend side of the contract)."""
+    if scope is None or scope.is_full or not rows:
+        return list(rows)
+    df = normalize_roster(rows)
+    return [row for row, keep in zip(rows, scope_mask(df, scope)) if keep]
+
+
+def normalize_roster(raw_rows):
+    """Build the roster DataFrame the admin tools expect from raw sheet rows."""
+    df_raw = pd.DataFrame(raw_rows)
+    if not df_raw.empty:
+        df_raw.columns = df_raw.columns.str.lower().str.strip()
+        if 'role' in df_raw.columns: df_raw['role'] = df_raw['role'].astype(str).str.strip()
+        if 'cottage' in df_raw.columns: df_raw['cottage'] = df_raw['cottage'].astype(str).str.strip()
+        if 'name' in df_raw.columns: df_raw['name'] = df_raw['name'].astype(str).str.strip()
+    return df_raw
+
+
+def parse_roster_response(payload):
+    """Split a fetch response into ``(rows, deleted, cursor, full)``."""
+    if isinstance(payload, list):
+        return payload, [], None, True
+    if not isinstance(payload, dict):
+        raise ValueError(f"Unexpected roster payload ({type(payload).__name__})")
+    rows = payload.get("rows") or []
+    if not isinstance(rows, list):
+        raise ValueError("Roster payload 'rows' must be a list")
+    return rows, list(payload.get("deleted") or []), payload.get("cursor"), bool(payload.get("full", False))
+
+
+def merge_roster(base_df, delta_df, deleted=()):
+    """Upsert ``delta_df`` into ``base_df`` by ``row_id`` and drop ``deleted`` ids.
+
+    Rows without a ``row_id`` cannot be matched, so they are simply appended.
+    """
+    if delta_df.empty and not deleted:
+        return base_df
+    if base_df.empty:
+        return delta_df.reset_index(drop=True)
+    if ROW_ID not in base_df.columns:
+        return pd.concat([base_df, delta_df], ignore_index=True)
+    replaced = set(deleted)
+    if ROW_ID in delta_df.columns:
+        replaced.update(delta_df[ROW_ID])
+    kept = base_df[~base_df[ROW_ID].isin(replaced)]
+    if delta_df.empty:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, delta_df], ignore_index=True)
+
+
+def save_snapshot(path, df, cursor, fetched_at):
+    """Atomically write the roster and its sync metadata next to each other."""
+    tmp = f"{path}.tmp"
+    # Sheet columns can mix numbers, blanks and text; Parquet needs one type per column.
+    out = df.copy()
+    for c in out.columns:
+        if out[c].dtype == object:
+            out[c] = out[c].map(lambda v: v if isinstance(v, str) or (pd.api.types.is_scalar(v) and pd.isna(v)) else str(v))
+    out.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    with open(tmp, "w") as f:
+        json.dump({"cursor": cursor, "fetched_at": fetched_at, "rows": len(df)}, f)
+    os.replace(tmp, f"{path}.json")
+
+
+def load_snapshot(path):
+    """Return ``(df, cursor, fetched_at)`` from disk, or None if there is no usable snapshot."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        df = pd.read_parquet(path)
+        meta = {}
+        if os.path.exists(f"{path}.json"):
+            with open(f"{path}.json") as f:
+                meta = json.load(f)
+    except Exception as e:
+        log.warning("Ignoring unreadable roster snapshot %s: %s", path, e)
+        return None
+    return df, meta.get("cursor"), meta.get("fetched_at")
+
+
+class RosterCache:
+    """Stale-while-revalidate holder for the normalized roster DataFrame.
+
+    ``fetch(since, scope)`` returns either a raw list of row dicts (full
+    snapshot) or a delta payload as described in the module docstring. It
+    should raise on any failure so the previous snapshot is kept.
+    """
+
+    def __init__(self, fetch, interval=ROSTER_REFRESH_SECONDS, snapshot_path=None, scope=RosterScope(),
+                 idle_after=ROSTER_IDLE_SECONDS):
+        self._fetch = fetch
+        self.scope = scope
+        self._interval = interval
+        self._idle_after = idle_after
+        self.last_read = time.time()
+        self._views = {}
+        self._snapshot_path = snapshot_path
+        self._lock = threading.Lock()
+        self._first_load = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._df = None
+        self.cursor = None
+        self.fetched_at = None
+        self.last_error = None
+        self.from_snapshot = False
+        self._listeners = []
+
+        snapshot = load_snapshot(snapshot_path)
+        if snapshot is not None:
+            self._df, self.cursor, self.fetched_at = snapshot
+            self.from_snapshot = True
+
+    def refresh(self):
+        """Fetch and swap in a new snapshot. Returns False (keeping the old one) on failure."""
+        with self._refreshing:
+            return self._refresh()
+
+    def _refresh(self):
+        since = self.cursor if self._df is not None else None
+        try:
+            rows, deleted, cursor, full = parse_roster_response(self._fetch(since, self.scope))
+            delta = normalize_roster(rows)
+            if not self.scope.is_full and not delta.empty:
+                in_scope = scope_mask(delta, self.scope)
+                if ROW_ID in delta.columns:
+                    deleted = deleted + delta.loc[~in_scope, ROW_ID].tolist()
+                delta = delta[in_scope].reset_index(drop=True)
+            if full or since is None:
+                df = delta
+                # Backends without a cursor resend the whole roster every time. Keep the old
+                # frame when nothing changed, so readers' derived views and caches stay valid.
+                if self._df is not None and df.equals(self._df):
+                    df, delta = self._df, delta.iloc[0:0]
+            else:
+                df = merge_roster(self._df, delta, deleted)
+        except Exception as e:
+            log.warning("Roster refresh failed, keeping previous snapshot: %s", e)
+            self.last_error = str(e)
+            return False
+        changed = df is not self._df or cursor != self.cursor
+        with self._lock:
+            if df is not self._df:
+                self._views = {}
+            self._df = df
+            self.cursor = cursor
+            self.fetched_at = time.time()
+            self.last_error = None
+            self.from_snapshot = False
+        if changed and self._snapshot_path:
+            try:
+                save_snapshot(self._snapshot_path, df, cursor, self.fetched_at)
+            except Exception as e:
+                log.warning("Could not persist roster snapshot: %s", e)
+        if not delta.empty:
+            self._notify(delta)
+        return True
+
+    def subscribe(self, callback):
+        """Call ``callback(rows_df)`` with every batch of new or changed rows.
+
+        The current snapshot, if any, is delivered immediately.
+        """
+        self._listeners.append(callback)
+        if self._df is not None and not self._df.empty:
+            callback(self._df)
+
+    def _notify(self, delta):
+        for callback in list(self._listeners):
+            try:
+                callback(delta)
+            except Exception as e:
+                log.warning("Roster listener %r failed: %s", callback, e)
+
+    def get(self):
+        """Return the current snapshot, blocking only if nothing has been loaded yet.
+
+        The frame is shared by every session using this cache and is replaced,
+        never modified, on refresh. Callers must not mutate it in place.
+        """
+        self.touch()
+        if self._df is None:
+            with self._first_load:
+                if self._df is None:
+                    self.refresh()
+        with self._lock:
+            return self._df if self._df is not None else pd.DataFrame()
+
+    def view(self, scope):
+        """The snapshot narrowed to ``scope``, a shared scope within this cache's scope.
+
+        Views are kept per scope and rebuilt only when the snapshot changes, so every
+        session with that scope reads the same frame (read-only, like ``get()``).
+        """
+        df = self.get()
+        if scope == self.scope or df.empty:
+            return df
+        with self._lock:
+            view = self._views.get(scope)
+            if view is None or view[0] is not df:
+                view = self._views[scope] = (df, df[scope_mask(df, scope)].reset_index(drop=True))
+            return view[1]
+
+    @property
+    def idle(self):
+        """True when the poller has stopped for lack of readers (the snapshot may be stale)."""
+        return self._thread is None and not self._stop.is_set()
+
+    def touch(self):
+        """Note a read, restarting the poller if it went idle."""
+        self.last_read = time.time()
+        if self.idle:
+            self.start()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="roster-refresh", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _stale(self):
+        return self.fetched_at is None or time.time() - self.fetched_at >= self._interval
+
+    def _run(self):
+        # A snapshot loaded from disk is served immediately but reconciled right away;
+        # a cache nobody has read yet (or read after going idle) loads now rather than
+        # after the first interval.
+        if self.from_snapshot or self._df is None or self._stale():
+            self.refresh()
+        while not self._stop.wait(self._interval):
+            with self._lock:
+                if time.time() - self.last_read > self._idle_after:
+                    self._thread = None   # touch() starts a new one
+                    return
+            self.refresh()
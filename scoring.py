@@ -0,0 +1,330 @@
+"""Vectorized scoring engine compiled from the question bank.
+
+The processing step used to walk ``COMM_QUESTIONS`` and ``MOTIVATION_QUESTIONS``
+item by item (dict lookups, weight parsing, forced/Likert branching) for every
+submission. ``ScoringEngine`` does that work once: each section of the bank is
+compiled into a feature-weight matrix ``W`` (features x styles), where a Likert
+item is one feature holding its keyed value (``6 - raw`` when ``reverse``) and
+a forced-choice item is two 0/1 features, one per option, weighted by
+``FORCED_WEIGHT``. Batches of answers are encoded into a feature matrix ``X``
+(respondents x features) and scored together. A single respondent (the app's
+case, once per submit) is summed in plain Python from the same compiled plan:
+numpy's per-call overhead on a 1-row array made that path slower than the
+loops it replaced.
+
+Results are bit-identical to the original loops. Whole-number weights sum
+exactly in any order, so the features before the first fractional weight
+(``STRESS_WEIGHT``) are one ``X @ W`` product; the rest are accumulated in bank
+order (``scores += X[:, f] * W[f]``), as the loops did. Summing the fractional
+ones in BLAS order could change the last bit of a score, and with it a
+primary/secondary tie-break.
+
+Burnout ``Context`` items are kept out of ``W`` and averaged separately.
+
+Adaptive mode asks items a page at a time and stops once the primary style or
+driver is statistically settled. Unanswered items are projected from the
+respondent's own answers: each remaining Likert item is expected to land at
+their mean keyed answer so far (with their observed variance), and each
+remaining forced choice is a coin flip between its two options. The leader is
+settled when its projected lead over every other style exceeds ``z`` standard
+deviations of the remaining points. Reported scores are those projections, so
+they stay on the same scale as a full assessment.
+"""
+import math
+
+import numpy as np
+
+from question_bank import (
+    COMM_QUESTIONS, COMM_STYLES, CONTEXT_STYLE, FORCED_WEIGHT, LIKERT_WEIGHT,
+    MOTIVATION_QUESTIONS, MOTIV_DRIVERS,
+)
+
+
+# Adaptive mode: page size, one-sided z for "settled", and a floor so nobody stops after one page.
+ADAPTIVE_PAGE_SIZE = 6
+ADAPTIVE_Z = 1.645
+ADAPTIVE_MIN_ITEMS = 12
+LIKERT_PRIOR_MEAN = 3.0
+LIKERT_PRIOR_VAR = 2.0      # variance of a uniform 1-5 answer
+LIKERT_MIN_VAR = 0.5        # keeps a run of identical answers from looking certain
+
+
+def normalize_role_key(role):
+    """Map a free-text role to the report variant it gets (anything unrecognized reads as YDP)."""
+    if not role: return "YDP"
+    r = role.lower()
+    if "program" in r: return "Program Supervisor"
+    if "shift" in r: return "Shift Supervisor"
+    return "YDP"
+
+
+def get_top_two(scores):
+    # sorted() is stable, so ties keep the dict's (profile) order.
+    sorted_scores = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    primary = sorted_scores[0][0] if len(sorted_scores) > 0 else None
+    secondary = sorted_scores[1][0] if len(sorted_scores) > 1 else None
+    return primary, secondary
+
+
+def top_two_indices(scores):
+    """Column indices of the two highest scores per row, ties broken like get_top_two."""
+    return np.argsort(-scores, axis=1, kind="stable")[:, :2]
+
+
+class CompiledSection:
+    """One part of the bank (communication or motivation) as a weight matrix."""
+
+    def __init__(self, questions, styles):
+        self.styles = list(styles)
+        col = {s: i for i, s in enumerate(self.styles)}
+        self.items = []        # (question, first feature index) for scored items, in bank order
+        self.context = []      # burnout Context questions
+        rows = []
+        for q in questions:
+            if q.get("style") == CONTEXT_STYLE:
+                self.context.append(q)
+                continue
+            self.items.append((q, len(rows)))
+            if q.get("type", "likert") == "forced":
+                for style in (q["a_style"], q["b_style"]):
+                    w = np.zeros(len(self.styles))
+                    w[col[style]] = FORCED_WEIGHT
+                    rows.append(w)
+            else:
+                w = np.zeros(len(self.styles))
+                w[col[q["style"]]] = float(q.get("weight", LIKERT_WEIGHT))
+                rows.append(w)
+        self.W = np.array(rows).reshape(len(rows), len(self.styles))
+        # Sums of whole-number weights are exact in any order, so score() takes the features up
+        # to the first fractional weight (STRESS_WEIGHT) as one matrix product and adds the rest
+        # in bank order, matching the old per-item loops float for float.
+        fractional = np.flatnonzero((self.W != np.round(self.W)).any(axis=1))
+        self._exact = int(fractional[0]) if len(fractional) else len(rows)
+        # Flattened per-item lookups so encode() does no dict work beyond reading answers.
+        self._plan = [
+            (q["id"], f, q.get("type", "likert") == "forced", q.get("a_text"), q.get("b_text"), bool(q.get("reverse", False)))
+            for q, f in self.items
+        ]
+        # Per item: (id, forced, column(s), weight, a_text, b_text, reverse) for score_one().
+        self._one_plan = []
+        for q, _ in self.items:
+            if q.get("type", "likert") == "forced":
+                self._one_plan.append((q["id"], True, (col[q["a_style"]], col[q["b_style"]]), FORCED_WEIGHT,
+                                       q.get("a_text"), q.get("b_text"), False))
+            else:
+                self._one_plan.append((q["id"], False, col[q["style"]], float(q.get("weight", LIKERT_WEIGHT)),
+                                       None, None, bool(q.get("reverse", False))))
+
+    def encode(self, answer_sets):
+        """Feature matrix for a list of ``{question_id: answer}`` dicts.
+
+        Likert answers may be ints or numeric strings; forced answers may be
+        ``"A"``/``"B"`` or the chosen statement text (as stored in the sheet).
+        A missing Likert answer yields NaN, so that respondent's scores are NaN.
+        """
+        width = self.W.shape[0]
+        rows = []
+        for answers in answer_sets:
+            row = [0.0] * width
+            for qid, f, forced, a_text, b_text, reverse in self._plan:
+                raw = answers.get(qid)
+                if forced:
+                    if raw == "A" or (raw is not None and raw == a_text):
+                        row[f] = 1.0
+                    elif raw == "B" or (raw is not None and raw == b_text):
+                        row[f + 1] = 1.0
+                    continue
+                try:
+                    value = int(raw)
+                except (TypeError, ValueError):
+                    row[f] = np.nan
+                    continue
+                row[f] = 6 - value if reverse else value
+            rows.append(row)
+        return np.array(rows, dtype=float).reshape(len(rows), width)
+
+    def encode_context(self, answer_sets):
+        B = np.full((len(answer_sets), len(self.context)), np.nan)
+        for r, answers in enumerate(answer_sets):
+            for c, q in enumerate(self.context):
+                try:
+                    B[r, c] = int(answers.get(q["id"]))
+                except (TypeError, ValueError):
+                    pass
+        return B
+
+    def score_one(self, answers):
+        """Style scores for one respondent as a list, or None if a Likert item is unanswered.
+
+        The same sums as ``score(encode([answers]))``, in the same (bank) order so the
+        floats match exactly, without building arrays for a single row: the app scores
+        one respondent per submit, where numpy's per-call overhead dominates.
+        """
+        scores = [0.0] * len(self.styles)
+        for qid, forced, cols, weight, a_text, b_text, reverse in self._one_plan:
+            raw = answers.get(qid)
+            if forced:
+                if raw == "A" or (raw is not None and raw == a_text):
+                    scores[cols[0]] += weight
+                elif raw == "B" or (raw is not None and raw == b_text):
+                    scores[cols[1]] += weight
+                continue
+            try:
+                value = int(raw)
+            except (TypeError, ValueError):
+                return None
+            scores[cols] += (6 - value if reverse else value) * weight
+        return scores
+
+    def burnout_one(self, answers):
+        """Unrounded mean of one respondent's Context answers (None when none)."""
+        values = []
+        for q in self.context:
+            try:
+                values.append(int(answers.get(q["id"])))
+            except (TypeError, ValueError):
+                pass
+        return sum(values) / len(values) if values else None
+
+    def score(self, X):
+        """Style scores (respondents x styles), equal to accumulating in bank order."""
+        scores = X[:, :self._exact] @ self.W[:self._exact]
+        for f in range(self._exact, self.W.shape[0]):
+            scores += X[:, f, None] * self.W[f]
+        return scores
+
+    # --- Adaptive mode ---
+    def new_running(self):
+        """Running totals for one respondent, kept in session state as plain data."""
+        return {"scores": [0.0] * len(self.styles), "answered": [], "n": 0, "sum": 0.0, "sumsq": 0.0}
+
+    def add_page(self, running, page_answers):
+        """Fold one page of answers into ``running`` (only that page is encoded)."""
+        page = {qid: v for qid, v in page_answers.items() if qid not in running["answered"]}
+        X = self.encode([page])
+        X[np.isnan(X)] = 0.0
+        running["scores"] = (np.array(running["scores"]) + self.score(X)[0]).tolist()
+        for q, f in self.items:
+            if q["id"] in page and q.get("type", "likert") != "forced" and X[0, f]:
+                running["n"] += 1
+                running["sum"] += X[0, f]
+                running["sumsq"] += X[0, f] ** 2
+        running["answered"] = running["answered"] + list(page)
+        return running
+
+    def project(self, running):
+        """Expected final scores and their covariance given the items answered so far."""
+        n = running["n"]
+        mu = running["sum"] / n if n else LIKERT_PRIOR_MEAN
+        var = max(running["sumsq"] / n - mu ** 2, LIKERT_MIN_VAR) if n > 1 else LIKERT_PRIOR_VAR
+        answered = set(running["answered"])
+        mean = np.array(running["scores"], dtype=float)
+        cov = np.zeros((len(self.styles), len(self.styles)))
+        for q, f in self.items:
+            if q["id"] in answered:
+                continue
+            if q.get("type", "likert") == "forced":
+                a, b = np.flatnonzero(self.W[f])[0], np.flatnonzero(self.W[f + 1])[0]
+                half = FORCED_WEIGHT / 2
+                mean[a] += half
+                mean[b] += half
+                cov[a, a] += half ** 2
+                cov[b, b] += half ** 2
+                cov[a, b] -= half ** 2
+                cov[b, a] -= half ** 2
+            else:
+                s = np.flatnonzero(self.W[f])[0]
+                mean[s] += self.W[f, s] * mu
+                cov[s, s] += self.W[f, s] ** 2 * var
+        return mean, cov
+
+    def remaining(self, running):
+        answered = set(running["answered"])
+        return [q for q, _ in self.items if q["id"] not in answered]
+
+    def settled(self, running, z=ADAPTIVE_Z, min_items=ADAPTIVE_MIN_ITEMS):
+        """True once the projected leader can no longer plausibly be overtaken."""
+        if not self.remaining(running):
+            return True
+        if len(running["answered"]) < min_items:
+            return False
+        mean, cov = self.project(running)
+        leader = int(np.argsort(-mean, kind="stable")[0])
+        for j in range(len(self.styles)):
+            if j == leader:
+                continue
+            sd = math.sqrt(max(cov[leader, leader] + cov[j, j] - 2 * cov[leader, j], 0.0))
+            if mean[leader] - mean[j] <= z * sd:
+                return False
+        return True
+
+
+class ScoringEngine:
+    def __init__(self, comm_questions=COMM_QUESTIONS, motiv_questions=MOTIVATION_QUESTIONS,
+                 comm_styles=COMM_STYLES, motiv_drivers=MOTIV_DRIVERS):
+        self.comm = CompiledSection(comm_questions, comm_styles)
+        self.motiv = CompiledSection(motiv_questions, motiv_drivers)
+
+    def score_matrix(self, comm_answer_sets, motiv_answer_sets):
+        """Score N respondents at once.
+
+        Returns ``(comm_scores, motiv_scores, burnout)``: two (N x 4) arrays and a
+        length-N array of unrounded burnout means (NaN when no Context answers).
+        """
+        comm = self.comm.score(self.comm.encode(comm_answer_sets))
+        motiv = self.motiv.score(self.motiv.encode(motiv_answer_sets))
+        B = self.motiv.encode_context(motiv_answer_sets)
+        answered = (~np.isnan(B)).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            burnout = np.where(answered > 0, np.nansum(B, axis=1) / answered, np.nan)
+        return comm, motiv, burnout
+
+    def results(self, comm, motiv, burnout):
+        """Build the ``results`` dicts the app stores from score_matrix() output."""
+        comm_top, motiv_top = top_two_indices(comm), top_two_indices(motiv)
+        out = []
+        for i in range(comm.shape[0]):
+            out.append({
+                "primaryComm": self.comm.styles[comm_top[i, 0]],
+                "secondaryComm": self.comm.styles[comm_top[i, 1]],
+                "primaryMotiv": self.motiv.styles[motiv_top[i, 0]],
+                "secondaryMotiv": self.motiv.styles[motiv_top[i, 1]],
+                "commScores": dict(zip(self.comm.styles, comm[i].tolist())),
+                "motivScores": dict(zip(self.motiv.styles, motiv[i].tolist())),
+                "burnoutScore": None if np.isnan(burnout[i]) else round(float(burnout[i]), 2),
+            })
+        return out
+
+    def score_many(self, comm_answer_sets, motiv_answer_sets):
+        return self.results(*self.score_matrix(comm_answer_sets, motiv_answer_sets))
+
+    def score(self, comm_answers, motiv_answers):
+        """Results dict for a single respondent. Raises ValueError if a Likert item is unanswered."""
+        comm, motiv = self.comm.score_one(comm_answers), self.motiv.score_one(motiv_answers)
+        if comm is None or motiv is None:
+            raise ValueError("Every Likert item must be answered before scoring")
+        comm, motiv = dict(zip(self.comm.styles, comm)), dict(zip(self.motiv.styles, motiv))
+        burnout = self.motiv.burnout_one(motiv_answers)
+        (p_comm, s_comm), (p_motiv, s_motiv) = get_top_two(comm), get_top_two(motiv)
+        return {
+            "primaryComm": p_comm, "secondaryComm": s_comm,
+            "primaryMotiv": p_motiv, "secondaryMotiv": s_motiv,
+            "commScores": comm, "motivScores": motiv,
+            "burnoutScore": None if burnout is None else round(burnout, 2),
+        }
+
+    def score_adaptive(self, comm_running, motiv_running, motiv_answers):
+        """Results dict for an adaptive (early-stopped) assessment, using projected scores."""
+        comm, _ = self.comm.project(comm_running)
+        motiv, _ = self.motiv.project(motiv_running)
+        B = self.motiv.encode_context([motiv_answers])
+        answered = int((~np.isnan(B)).sum())
+        burnout = np.array([np.nansum(B) / answered if answered else np.nan])
+        results = self.results(comm[None, :], motiv[None, :], burnout)[0]
+        results["adaptive"] = True
+        results["itemsAnswered"] = len(comm_running["answered"]) + len(motiv_running["answered"])
+        return results
+
+
+# Compiled once per process; reused by the app and batch jobs.
+ENGINE = ScoringEngine()
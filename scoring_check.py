@@ -0,0 +1,278 @@
+"""Regression and throughput check for the scoring engine.
+
+    python scoring_check.py                  # golden file + 5,000 synthetic answer sets
+    python scoring_check.py -n 50000 --bench # more cases, plus respondents/second
+    python scoring_check.py --update-golden  # after an intentional question bank change
+
+What it checks:
+
+* ``reference_score`` - the original per-item loops from the processing step,
+  kept verbatim - against ``scoring.ENGINE`` on synthetic answer sets, both
+  one at a time and as one batch. Results must match exactly (floats included).
+* Reverse-keyed items, which the live bank does not use yet, through a small
+  custom bank.
+* ``scoring_golden.json``: fixed answer sets with their expected results, so a
+  change that moves anybody's profile is caught even if the reference moved too.
+* Explicit tie outcomes for ``get_top_two``: equal scores resolve in profile
+  order (Director, Encourager, Facilitator, Tracker / Growth, Purpose,
+  Connection, Achievement), so an optimization cannot silently relabel people.
+* ``normalize_role_key`` mappings.
+
+Exits non-zero on any failure.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+from question_bank import (
+    COMM_QUESTIONS, COMM_STYLES, FORCED_WEIGHT, LIKERT_WEIGHT, MOTIVATION_QUESTIONS,
+    MOTIV_DRIVERS, QUESTION_BANK_VERSION, STRESS_WEIGHT,
+)
+from scoring import ENGINE, ScoringEngine, get_top_two, normalize_role_key, top_two_indices
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_golden.json")
+GOLDEN_CASES = 100
+
+
+def reference_score(answers_comm, answers_motiv, comm_questions=COMM_QUESTIONS, motiv_questions=MOTIVATION_QUESTIONS):
+    """The scoring loops exactly as they were in app.py's processing step."""
+    def calculate_points(raw_score, is_reverse=False):
+        if is_reverse:
+            return 6 - raw_score
+        return raw_score
+
+    c_scores = {k: 0.0 for k in COMM_STYLES}
+    m_scores = {k: 0.0 for k in MOTIV_DRIVERS}
+    burnout_items = []
+
+    for q in comm_questions:
+        raw_val = answers_comm.get(q["id"])
+        qtype = q.get("type", "likert")
+        weight = float(q.get("weight", LIKERT_WEIGHT))
+        if qtype == "forced":
+            if raw_val == "A":
+                c_scores[q["a_style"]] += FORCED_WEIGHT
+            elif raw_val == "B":
+                c_scores[q["b_style"]] += FORCED_WEIGHT
+            continue
+        points = calculate_points(int(raw_val), q.get("reverse", False)) * weight
+        c_scores[q["style"]] += points
+
+    for q in motiv_questions:
+        raw_val = answers_motiv.get(q["id"])
+        qtype = q.get("type", "likert")
+        if q.get("style") == "Context":
+            if raw_val is not None:
+                burnout_items.append(int(raw_val))
+            continue
+        if qtype == "forced":
+            if raw_val == "A":
+                m_scores[q["a_style"]] += FORCED_WEIGHT
+            elif raw_val == "B":
+                m_scores[q["b_style"]] += FORCED_WEIGHT
+            continue
+        points = calculate_points(int(raw_val), q.get("reverse", False)) * float(q.get("weight", LIKERT_WEIGHT))
+        m_scores[q["style"]] += points
+
+    burnout_score = round(sum(burnout_items) / len(burnout_items), 2) if burnout_items else None
+    p_comm, s_comm = get_top_two(c_scores)
+    p_mot, s_mot = get_top_two(m_scores)
+    return {
+        "primaryComm": p_comm, "secondaryComm": s_comm,
+        "primaryMotiv": p_mot, "secondaryMotiv": s_mot,
+        "commScores": c_scores, "motivScores": m_scores,
+        "burnoutScore": burnout_score,
+    }
+
+
+def synthetic_answers(rng, questions):
+    """One answer set. Mixes uniform, straight-lined and style-leaning respondents so ties are common."""
+    mode = rng.random()
+    flat = rng.randint(1, 5)
+    lean = {s: rng.gauss(3, 1) for s in COMM_STYLES + MOTIV_DRIVERS + ["Context"]}
+    answers = {}
+    for q in questions:
+        if q.get("type", "likert") == "forced":
+            answers[q["id"]] = "A" if mode < 0.2 else rng.choice("AB")
+        elif mode < 0.3:
+            answers[q["id"]] = flat
+        elif mode < 0.6:
+            answers[q["id"]] = min(5, max(1, round(lean[q["style"]] + rng.gauss(0, 0.7))))
+        else:
+            answers[q["id"]] = rng.randint(1, 5)
+        if q.get("style") == "Context" and rng.random() < 0.1:
+            answers.pop(q["id"])
+    return answers
+
+
+def synthetic_cases(n, seed=20240601):
+    rng = random.Random(seed)
+    return [(synthetic_answers(rng, COMM_QUESTIONS), synthetic_answers(rng, MOTIVATION_QUESTIONS)) for _ in range(n)]
+
+
+class Check:
+    def __init__(self):
+        self.failures = 0
+
+    def expect(self, ok, message):
+        if not ok:
+            self.failures += 1
+            print(f"FAIL {message}")
+        return ok
+
+
+def check_engine(check, cases):
+    mismatches = 0
+    for comm, motiv in cases:
+        expected = reference_score(comm, motiv)
+        if ENGINE.score(comm, motiv) != expected:
+            mismatches += 1
+            if mismatches <= 3:
+                check.expect(False, f"single-respondent result differs for {comm} / {motiv}")
+    batch = ENGINE.score_many([c for c, _ in cases], [m for _, m in cases])
+    batch_mismatches = sum(r != reference_score(c, m) for r, (c, m) in zip(batch, cases))
+    check.expect(mismatches == 0, f"{mismatches} of {len(cases)} single results differ from the reference")
+    check.expect(batch_mismatches == 0, f"{batch_mismatches} of {len(cases)} batch results differ from the reference")
+    print(f"ok   engine matches reference on {len(cases)} synthetic answer sets")
+
+
+def check_reverse_keying(check):
+    comm_bank = [
+        {"id": "x1", "type": "likert", "style": "Director", "text": ""},
+        {"id": "x2", "type": "likert", "style": "Director", "reverse": True, "text": ""},
+        {"id": "x3", "type": "likert", "style": "Tracker", "reverse": True, "weight": STRESS_WEIGHT, "text": ""},
+        {"id": "x4", "type": "forced", "prompt": "", "a_style": "Tracker", "a_text": "a", "b_style": "Encourager", "b_text": "b"},
+    ]
+    motiv_bank = [
+        {"id": "y1", "type": "likert", "style": "Growth", "reverse": True, "text": ""},
+        {"id": "y2", "type": "likert", "style": "Context", "text": ""},
+    ]
+    engine = ScoringEngine(comm_bank, motiv_bank)
+    for raw in range(1, 6):
+        comm = {"x1": raw, "x2": raw, "x3": 6 - raw, "x4": "B" if raw % 2 else "A"}
+        motiv = {"y1": raw, "y2": raw}
+        check.expect(
+            engine.score(comm, motiv) == reference_score(comm, motiv, comm_bank, motiv_bank),
+            f"reverse-keyed items score differently for raw={raw}",
+        )
+    print("ok   reverse keying")
+
+
+def check_ties(check):
+    cases = [
+        ({s: 10.0 for s in COMM_STYLES}, ("Director", "Encourager")),
+        ({"Director": 5.0, "Encourager": 9.0, "Facilitator": 9.0, "Tracker": 9.0}, ("Encourager", "Facilitator")),
+        ({"Director": 9.0, "Encourager": 5.0, "Facilitator": 5.0, "Tracker": 9.0}, ("Director", "Tracker")),
+        ({"Director": 1.0, "Encourager": 2.0, "Facilitator": 3.0, "Tracker": 3.0}, ("Facilitator", "Tracker")),
+        ({s: 0.0 for s in MOTIV_DRIVERS}, ("Growth", "Purpose")),
+        ({"Growth": 4.0, "Purpose": 7.0, "Connection": 7.0, "Achievement": 7.0}, ("Purpose", "Connection")),
+        ({"Growth": 7.0, "Purpose": 4.0, "Connection": 4.0, "Achievement": 7.0}, ("Growth", "Achievement")),
+    ]
+    for scores, expected in cases:
+        check.expect(get_top_two(scores) == expected, f"get_top_two({scores}) != {expected}")
+        idx = top_two_indices(np.array([list(scores.values())]))[0]
+        labels = tuple(list(scores)[i] for i in idx)
+        check.expect(labels == expected, f"top_two_indices({scores}) gave {labels}, expected {expected}")
+    # Straight-lining every item (all 3s, all forced A) must land on a fixed profile.
+    comm = {q["id"]: ("A" if q.get("type") == "forced" else 3) for q in COMM_QUESTIONS}
+    motiv = {q["id"]: ("A" if q.get("type") == "forced" else 3) for q in MOTIVATION_QUESTIONS}
+    result = ENGINE.score(comm, motiv)
+    check.expect(result == reference_score(comm, motiv), "straight-lined answers differ from the reference")
+    print(f"ok   tie-breaks (straight-lined 3s/A -> {result['primaryComm']}/{result['secondaryComm']}, "
+          f"{result['primaryMotiv']}/{result['secondaryMotiv']})")
+
+
+def check_roles(check):
+    cases = {
+        None: "YDP", "": "YDP", "YDP": "YDP", "TSS Staff": "YDP", "Director": "YDP",
+        "Program Supervisor": "Program Supervisor", "program supervisor (acting)": "Program Supervisor",
+        "Shift Supervisor": "Shift Supervisor", "Overnight SHIFT lead": "Shift Supervisor",
+        "Program Shift Lead": "Program Supervisor",  # "program" wins when both appear
+    }
+    for role, expected in cases.items():
+        check.expect(normalize_role_key(role) == expected, f"normalize_role_key({role!r}) != {expected!r}")
+    print("ok   normalize_role_key")
+
+
+def check_golden(check, update=False):
+    cases = synthetic_cases(GOLDEN_CASES, seed=7)
+    if update:
+        golden = {
+            "bank_version": QUESTION_BANK_VERSION,
+            "cases": [{"comm": c, "motiv": m, "expected": reference_score(c, m)} for c, m in cases],
+        }
+        with open(GOLDEN_PATH, "w") as f:
+            json.dump(golden, f, indent=0, sort_keys=True)
+        print(f"ok   wrote {GOLDEN_PATH} for bank {QUESTION_BANK_VERSION}")
+        return
+    if not check.expect(os.path.exists(GOLDEN_PATH), f"{GOLDEN_PATH} missing (run with --update-golden)"):
+        return
+    with open(GOLDEN_PATH) as f:
+        golden = json.load(f)
+    if golden["bank_version"] != QUESTION_BANK_VERSION:
+        print(f"note golden file is for bank {golden['bank_version']}, current bank is {QUESTION_BANK_VERSION}; "
+              "differences below may be intentional (re-run with --update-golden once reviewed)")
+    changed = 0
+    for case in golden["cases"]:
+        got = ENGINE.score(case["comm"], case["motiv"])
+        if got != case["expected"]:
+            changed += 1
+            if changed <= 3:
+                exp = case["expected"]
+                print(f"     {exp['primaryComm']}/{exp['primaryMotiv']} -> {got['primaryComm']}/{got['primaryMotiv']}")
+    check.expect(changed == 0, f"{changed} of {len(golden['cases'])} golden results changed")
+    if not changed:
+        print(f"ok   golden file ({len(golden['cases'])} cases)")
+
+
+def benchmark(cases):
+    comm, motiv = [c for c, _ in cases], [m for _, m in cases]
+    timings = []
+    started = time.perf_counter()
+    for c, m in cases:
+        reference_score(c, m)
+    timings.append(("reference loops", time.perf_counter() - started))
+    started = time.perf_counter()
+    for c, m in cases:
+        ENGINE.score(c, m)
+    timings.append(("ENGINE.score (one at a time)", time.perf_counter() - started))
+    started = time.perf_counter()
+    ENGINE.score_many(comm, motiv)
+    timings.append(("ENGINE.score_many (batch)", time.perf_counter() - started))
+    started = time.perf_counter()
+    ENGINE.score_matrix(comm, motiv)
+    timings.append(("ENGINE.score_matrix (arrays only)", time.perf_counter() - started))
+    for label, seconds in timings:
+        print(f"     {label:<36} {len(cases) / seconds:>12,.0f} respondents/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the scoring engine against the reference implementation.")
+    parser.add_argument("-n", type=int, default=5000, help="number of synthetic answer sets")
+    parser.add_argument("--bench", action="store_true", help="also report scoring throughput")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite scoring_golden.json from the reference scorer")
+    args = parser.parse_args(argv)
+
+    check = Check()
+    if args.update_golden:
+        check_golden(check, update=True)
+        return 0
+    cases = synthetic_cases(args.n)
+    check_engine(check, cases)
+    check_reverse_keying(check)
+    check_ties(check)
+    check_roles(check)
+    check_golden(check)
+    if args.bench:
+        benchmark(cases)
+    print("FAILED" if check.failures else "PASSED")
+    return 1 if check.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
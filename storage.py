@@ -0,0 +1,369 @@
+"""Pluggable storage for assessment results and the staff roster.
+
+Every read and write used to go straight to one Apps Script URL. The app and
+portal now talk to a ``StorageBackend`` instead:
+
+* ``AppsScriptStorage`` - the existing Google Sheet behind Apps Script.
+* ``SqliteStorage``     - a local database with indexes on email, cottage and
+  timestamp, for offline work, load tests and deployments that outgrow Sheets'
+  per-request latency and quotas.
+
+Pick one with the ``COMPASS_STORAGE`` environment variable (``apps_script`` by
+default, or ``sqlite``). Roster reads follow the delta/scope protocol described
+in roster.py.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+from config import APPS_SCRIPT_BATCH_SAVE, APPS_SCRIPT_RESCORE, GOOGLE_SCRIPT_URL, STORAGE_BACKEND, data_path
+from http_client import get_http_client
+from roster import ROW_ID, RosterCache, RosterScope, filter_rows
+
+ROSTER_FIELDS = ["name", "email", "role", "cottage", "p_comm", "s_comm", "p_mot", "s_mot"]
+
+
+class StorageError(Exception):
+    """A backend rejected or could not complete a request.
+
+    ``saved`` is how many records of a ``save_batch`` call were written before it failed.
+    """
+
+    def __init__(self, message, saved=0):
+        super().__init__(message)
+        self.saved = saved
+
+
+class RescoringUnsupported(StorageError):
+    """The backend can't list stored answers or write back scores (see ``supports_rescoring``)."""
+
+    def __init__(self, detail=""):
+        super().__init__("This storage backend does not support rescoring" + (f": {detail}" if detail else "."))
+
+
+class StorageBackend:
+    """Interface shared by all backends.
+
+    Records are submission payloads: ``name``, ``email``, ``role``, ``cottage``,
+    ``scores`` (``primaryComm``, ``secondaryComm``, ... plus optional score
+    dicts), optional compact ``answers`` with their ``bank_version`` (see
+    question_bank.encode_answers), an optional ``order_seed`` (see
+    question_bank.question_order) and an optional ``submission_id`` idempotency
+    key. Write methods raise ``StorageError`` on failure.
+
+    ``scoped_reads`` says whether ``list_since`` filters by ``scope`` on the
+    server. When it doesn't, the roster is cached once for the whole org and
+    narrowed locally (see get_roster_cache).
+
+    ``supports_rescoring`` says whether ``iter_answers`` and ``update_scores``
+    work; when they don't they raise ``RescoringUnsupported``.
+    """
+    scoped_reads = False
+    supports_rescoring = False
+
+    def save(self, record):
+        raise NotImplementedError
+
+    def save_batch(self, records):
+        records = list(records)
+        for i, record in enumerate(records):
+            try:
+                self.save(record)
+            except Exception as e:
+                raise StorageError(f"Saved {i} of {len(records)} rows, then: {e}", saved=i) from e
+
+    def retrieve_by_email(self, email):
+        """Latest result for ``email`` as ``{"found", "user_info", "scores"}``, or None."""
+        raise NotImplementedError
+
+    def list_roster(self, scope=None):
+        """Every roster row ``scope`` permits, as a list of dicts."""
+        raise NotImplementedError
+
+    def list_since(self, cursor=None, scope=None):
+        """Roster rows changed after ``cursor`` (all rows when None), as a delta payload."""
+        raise NotImplementedError
+
+    def iter_answers(self, batch_size=5000):
+        """Yield lists of ``{"key", "answers", "scores"}`` for every stored submission.
+
+        ``answers`` is the per-question dict saved with the submission (compact
+        or, for older rows, readable; scoring accepts both);
+        ``key`` identifies the record for update_scores().
+        """
+        raise RescoringUnsupported()
+
+    def update_scores(self, updates):
+        """Replace the stored ``scores`` for ``[(key, scores), ...]``."""
+        raise RescoringUnsupported()
+
+
+class AppsScriptStorage(StorageBackend):
+    # The deployed script ignores the `scope` parameter and always returns the whole sheet.
+    scoped_reads = False
+
+    def __init__(self, url=GOOGLE_SCRIPT_URL, client=None, batch_save=APPS_SCRIPT_BATCH_SAVE,
+                 rescoring=APPS_SCRIPT_RESCORE):
+        self.url = url
+        self.client = client or get_http_client()
+        self.batch_save = batch_save
+        self.supports_rescoring = rescoring
+
+    def _post(self, endpoint, body):
+        resp = self.client.post(endpoint, self.url, json=body)
+        if resp.status_code != 200:
+            raise StorageError(f"Google Sheets Error ({resp.status_code}): {resp.text[:200]}")
+        return resp
+
+    def save(self, record):
+        self._post("apps_script.write", dict(record, action="save"))
+
+    def save_batch(self, records):
+        # saveBatch needs a script update (see APPS_SCRIPT_BATCH_SAVE); older deployments
+        # answer 200 to actions they don't know, so the reply must acknowledge every row.
+        if not self.batch_save:
+            return super().save_batch(records)
+        rows = list(records)
+        resp = self._post("apps_script.write", {"action": "saveBatch", "rows": rows})
+        try:
+            saved = resp.json().get("saved")
+        except (ValueError, AttributeError):
+            saved = None
+        if saved != len(rows):
+            raise StorageError(f"saveBatch not acknowledged (expected saved={len(rows)}, got {resp.text[:200]!r})",
+                               saved=saved if isinstance(saved, int) else 0)
+
+    def retrieve_by_email(self, email):
+        return self._post("apps_script.lookup", {"action": "retrieve", "email": email}).json()
+
+    def _get(self, params):
+        resp = self.client.get("apps_script.read", self.url, params=params)
+        if resp.status_code != 200:
+            raise StorageError(f"Google Sheets Error ({resp.status_code}): {resp.text[:200]}")
+        return resp.json()
+
+    def list_roster(self, scope=None):
+        payload = self._get(self._scope_params(scope))
+        rows = payload if isinstance(payload, list) else payload.get("rows", [])
+        return filter_rows(rows, scope)
+
+    def list_since(self, cursor=None, scope=None):
+        params = self._scope_params(scope)
+        if cursor:
+            params["since"] = cursor
+        return self._get(params)
+
+    def iter_answers(self, batch_size=5000):
+        # Paged by an opaque cursor; the script returns {"rows": [...], "cursor": ..., "done": bool}.
+        # Like saveBatch, a script without the action still answers 200, so check the shape.
+        if not self.supports_rescoring:
+            raise RescoringUnsupported("the Apps Script has no listAnswers action (see APPS_SCRIPT_RESCORE)")
+        cursor = None
+        while True:
+            body = {"action": "listAnswers", "limit": batch_size}
+            if cursor:
+                body["cursor"] = cursor
+            resp = self._post("apps_script.read", body)
+            try:
+                page = resp.json()
+            except ValueError:
+                page = None
+            if not isinstance(page, dict) or not isinstance(page.get("rows"), list):
+                raise RescoringUnsupported(f"listAnswers not understood (got {resp.text[:200]!r})")
+            if page["rows"]:
+                yield page["rows"]
+            cursor = page.get("cursor")
+            if page.get("done", True) or not cursor:
+                return
+
+    def update_scores(self, updates):
+        if not self.supports_rescoring:
+            raise RescoringUnsupported("the Apps Script has no updateScores action (see APPS_SCRIPT_RESCORE)")
+        rows = [{"key": key, "scores": scores} for key, scores in updates]
+        resp = self._post("apps_script.write", {"action": "updateScores", "rows": rows})
+        try:
+            updated = resp.json().get("updated")
+        except (ValueError, AttributeError):
+            updated = None
+        if updated is None:
+            raise RescoringUnsupported(f"updateScores not understood (got {resp.text[:200]!r})")
+        if updated != len(rows):
+            raise StorageError(f"updateScores updated {updated} of {len(rows)} rows")
+
+    @staticmethod
+    def _scope_params(scope):
+        return {"scope": scope.to_json()} if scope is not None and not scope.is_full else {}
+
+
+class SqliteStorage(StorageBackend):
+    """Local backend.
+
+    ``seq`` is bumped on every insert or score update and is the sync cursor, so
+    rescored rows reach the roster caches as ordinary deltas.
+    """
+    scoped_reads = True
+    supports_rescoring = True
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS submissions (
+                    row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    submission_id TEXT UNIQUE,
+                    timestamp REAL NOT NULL,
+                    name TEXT, email TEXT, role TEXT, cottage TEXT,
+                    p_comm TEXT, s_comm TEXT, p_mot TEXT, s_mot TEXT,
+                    scores TEXT, answers TEXT, seq INTEGER, order_seed INTEGER, bank_version TEXT
+                );
+                """
+            )
+            columns = {r["name"] for r in self._conn.execute("PRAGMA table_info(submissions)")}
+            if "seq" not in columns:
+                # Databases created before rescoring: row_id was the cursor, so start seq from it.
+                self._conn.execute("ALTER TABLE submissions ADD COLUMN seq INTEGER")
+                self._conn.execute("UPDATE submissions SET seq = row_id")
+            for column, kind in (("order_seed", "INTEGER"), ("bank_version", "TEXT")):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE submissions ADD COLUMN {column} {kind}")
+            self._conn.executescript(
+                """
+                CREATE INDEX IF NOT EXISTS idx_submissions_email ON submissions(lower(email), timestamp);
+                CREATE INDEX IF NOT EXISTS idx_submissions_cottage ON submissions(cottage);
+                CREATE INDEX IF NOT EXISTS idx_submissions_timestamp ON submissions(timestamp);
+                CREATE INDEX IF NOT EXISTS idx_submissions_seq ON submissions(seq);
+                """
+            )
+
+    @staticmethod
+    def _params(record):
+        scores = record.get("scores") or {}
+        return (
+            record.get("submission_id"),
+            record.get("timestamp") or time.time(),
+            str(record.get("name", "")).strip(),
+            str(record.get("email", "") or "").strip(),
+            str(record.get("role", "")).strip(),
+            str(record.get("cottage", "")).strip(),
+            scores.get("primaryComm"), scores.get("secondaryComm"),
+            scores.get("primaryMotiv"), scores.get("secondaryMotiv"),
+            json.dumps(scores),
+            json.dumps(record["answers"]) if record.get("answers") is not None else None,
+            record.get("order_seed"),
+            record.get("bank_version"),
+        )
+
+    def save_batch(self, records):
+        with self._lock, self._conn:
+            # A repeated submission_id (outbox redelivery) is ignored, not duplicated.
+            self._conn.executemany(
+                """INSERT OR IGNORE INTO submissions
+                   (submission_id, timestamp, name, email, role, cottage, p_comm, s_comm, p_mot, s_mot, scores, answers, order_seed, bank_version, seq)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM submissions))""",
+                [self._params(r) for r in records],
+            )
+
+    def save(self, record):
+        self.save_batch([record])
+
+    def retrieve_by_email(self, email):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM submissions WHERE lower(email) = lower(?) ORDER BY timestamp DESC, row_id DESC LIMIT 1",
+                (str(email).strip(),),
+            ).fetchone()
+        if row is None:
+            return {"found": False}
+        return {
+            "found": True,
+            "user_info": {k: row[k] for k in ("name", "email", "role", "cottage")},
+            "scores": json.loads(row["scores"] or "{}"),
+        }
+
+    def _rows(self, where="1=1", args=(), scope=None):
+        if scope is not None and scope.cottage is not None:
+            where += " AND cottage = ?"
+            args += (scope.cottage,)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT row_id, timestamp, {', '.join(ROSTER_FIELDS)}, scores FROM submissions WHERE {where} ORDER BY row_id",
+                args,
+            ).fetchall()
+        return filter_rows([dict(r) for r in rows], scope)
+
+    def list_roster(self, scope=None):
+        return self._rows(scope=scope)
+
+    def list_since(self, cursor=None, scope=None):
+        since = int(cursor) if cursor not in (None, "") else None
+        with self._lock:
+            latest = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM submissions").fetchone()[0]
+        rows = self._rows("seq > ? AND seq <= ?", (since, latest), scope) if since is not None else self._rows("seq <= ?", (latest,), scope)
+        return {"rows": rows, "deleted": [], "cursor": str(latest), "full": since is None}
+
+    def iter_answers(self, batch_size=5000):
+        last = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {ROW_ID}, answers, scores FROM submissions WHERE {ROW_ID} > ? AND answers IS NOT NULL ORDER BY {ROW_ID} LIMIT ?",
+                    (last, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][ROW_ID]
+            yield [{"key": r[ROW_ID], "answers": json.loads(r["answers"]), "scores": json.loads(r["scores"] or "{}")} for r in rows]
+
+    def update_scores(self, updates):
+        with self._lock, self._conn:
+            for key, scores in updates:
+                self._conn.execute(
+                    """UPDATE submissions SET scores = ?, p_comm = ?, s_comm = ?, p_mot = ?, s_mot = ?,
+                           seq = (SELECT COALESCE(MAX(seq), 0) + 1 FROM submissions)
+                       WHERE row_id = ?""",
+                    (json.dumps(scores), scores.get("primaryComm"), scores.get("secondaryComm"),
+                     scores.get("primaryMotiv"), scores.get("secondaryMotiv"), key),
+                )
+
+
+def make_storage(kind=STORAGE_BACKEND):
+    if kind == "sqlite":
+        return SqliteStorage(data_path("compass.sqlite3"))
+    if kind == "apps_script":
+        return AppsScriptStorage()
+    raise ValueError(f"Unknown storage backend {kind!r} (expected 'apps_script' or 'sqlite')")
+
+
+@st.cache_resource
+def get_storage():
+    """The configured backend, created once per server process."""
+    return make_storage()
+
+
+def get_roster_cache(scope=RosterScope()):
+    """The background-refreshed roster cache that serves ``scope`` (see roster.py).
+
+    Backends that filter server-side get one cache per scope. For the others
+    every scope is served by the single full-org cache, so the sheet is pulled
+    once per interval rather than once per scope; read it through
+    ``cache.view(scope)``.
+    """
+    if not get_storage().scoped_reads:
+        scope = RosterScope()
+    return _roster_cache(scope)
+
+
+@st.cache_resource
+def _roster_cache(scope):
+    # Reads are delta + scope aware, and a Parquet snapshot on disk gives warm
+    # starts after a deploy or restart.
+    snapshot = data_path("roster", f"{scope.key()}.parquet")
+    return RosterCache(get_storage().list_since, scope=scope, snapshot_path=snapshot).start()